@@ -7,8 +7,9 @@ This module provides a Pythonic wrapper around the Rust oboron extension,
 adding proper inheritance and type checking support.
 """
 
-from abc import ABC, abstractmethod
-from typing import Protocol
+import sys
+from itertools import product
+from typing import List, Optional, Protocol, Union
 from . import _oboron
 from . import formats
 
@@ -27,12 +28,45 @@ class ObtextCodec(Protocol):
     def encoding(self) -> str: ...
 
 
-class OboronBase(ABC):
+class ObtextBatchCodec(ObtextCodec, Protocol):
+    """`ObtextCodec` plus the batch, bytes and buffer methods of the built-in codecs."""
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
+
+
+class _CodecMeta(type):
+    """
+    Metaclass answering isinstance()/issubclass() for the Rust codec classes.
+
+    A class matches if it is the extension class for one of the names in
+    the base's own `_codec_names`: a frozenset lookup plus an identity
+    check, instead of the WeakSet walk of an ABC virtual-subclass registry.
+    The set is read from the class `__dict__`, so only the declaring base
+    claims the Rust classes; Python subclasses of it, and checks against
+    them, go through the normal MRO check.
+    """
+
+    def __instancecheck__(cls, instance):
+        return cls.__subclasscheck__(type(instance))
+
+    def __subclasscheck__(cls, subclass):
+        name = getattr(subclass, '__name__', None)
+        names = cls.__dict__.get('_codec_names', frozenset())
+        if name in names and getattr(_oboron, name, None) is subclass:
+            return True
+        return type.__subclasscheck__(cls, subclass)
+
+
+class OboronBase(metaclass=_CodecMeta):
     """
-    Abstract base class for all Oboron codec implementations.
+    Base class for all Oboron codec implementations.
 
-    All codec classes (AasvB32, AasvC32, etc.) are registered as virtual
-    subclasses, enabling isinstance() and issubclass() checks.
+    All codec classes (AasvB32, AasvC32, etc.) are recognized by
+    isinstance() and issubclass() checks.
 
     Example:
         >>> cipher = AasvC32(key=key)
@@ -43,232 +77,98 @@ class OboronBase(ABC):
         ...     return cipher.enc("hello")
     """
 
-    @abstractmethod
     def enc(self, plaintext: str) -> str:
         """Encrypt and encode plaintext to obtext."""
         ...
 
-    @abstractmethod
     def dec(self, obtext: str) -> str:
         """Decode and decrypt obtext to plaintext."""
         ...
 
+    def enc_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt and encode a batch of plaintexts in a single call."""
+        ...
+
+    def dec_many(self, obtexts: List[str]) -> List[str]:
+        """Decode and decrypt a batch of obtexts in a single call."""
+        ...
+
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Encrypt and encode UTF-8 plaintext bytes to ASCII obtext bytes."""
+        ...
+
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Decode and decrypt ASCII obtext bytes to UTF-8 plaintext bytes."""
+        ...
+
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int:
+        """Encrypt and encode UTF-8 plaintext bytes into `out`; return the length written."""
+        ...
+
+    def max_output_len(self, plaintext_len: int) -> int:
+        """Get the `out` size `enc_into()` needs for a plaintext of this many bytes."""
+        ...
+
     @property
-    @abstractmethod
     def format(self) -> str:
         """Get the format identifier (e.g., 'aasv.b64')."""
         ...
 
     @property
-    @abstractmethod
     def scheme(self) -> str:
         """Get the scheme identifier (e.g., 'aasv')."""
         ...
 
     @property
-    @abstractmethod
     def encoding(self) -> str:
         """Get the encoding format (e.g., 'c32')."""
         ...
 
     @property
-    @abstractmethod
     def key(self) -> str:
         """Get the encryption key as a base64 string."""
         ...
 
     @property
-    @abstractmethod
     def key_hex(self) -> str:
         """Get the encryption key as a hex string."""
         ...
 
     @property
-    @abstractmethod
     def key_bytes(self) -> bytes:
         """Get the encryption key as raw bytes."""
         ...
 
+    _codec_names = frozenset()
 
-# ============================================================================
-# Register all Rust classes as virtual subclasses
-# ============================================================================
-
-# Aags variants
-OboronBase.register(_oboron.AagsC32)
-OboronBase.register(_oboron.AagsB32)
-OboronBase.register(_oboron.AagsB64)
-OboronBase.register(_oboron.AagsHex)
-
-# Aasv variants
-OboronBase.register(_oboron.AasvC32)
-OboronBase.register(_oboron.AasvB32)
-OboronBase.register(_oboron.AasvB64)
-OboronBase.register(_oboron.AasvHex)
-
-# Apgs variants
-OboronBase.register(_oboron.ApgsC32)
-OboronBase.register(_oboron.ApgsB32)
-OboronBase.register(_oboron.ApgsB64)
-OboronBase.register(_oboron.ApgsHex)
-
-# Apsv variants
-OboronBase.register(_oboron.ApsvC32)
-OboronBase.register(_oboron.ApsvB32)
-OboronBase.register(_oboron.ApsvB64)
-OboronBase.register(_oboron.ApsvHex)
-
-# Upbc variants
-OboronBase.register(_oboron.UpbcC32)
-OboronBase.register(_oboron.UpbcB32)
-OboronBase.register(_oboron.UpbcB64)
-OboronBase.register(_oboron.UpbcHex)
-
-# Mock1 variants (testing)
-OboronBase.register(_oboron.Mock1C32)
-OboronBase.register(_oboron.Mock1B32)
-OboronBase.register(_oboron.Mock1B64)
-OboronBase.register(_oboron.Mock1Hex)
-
-# Mock2 variants (testing)
-OboronBase.register(_oboron.Mock2C32)
-OboronBase.register(_oboron.Mock2B32)
-OboronBase.register(_oboron.Mock2B64)
-OboronBase.register(_oboron.Mock2Hex)
-
-# Flexible interfaces
-OboronBase.register(_oboron.Ob)
-
-# ============================================================================
-# Re-export all classes and functions
-# ============================================================================
-
-# Main flexible interfaces
-Ob = _oboron.Ob
-Omnib = _oboron.Omnib
-
-
-# Aags variants
-AagsC32 = _oboron.AagsC32
-AagsB32 = _oboron.AagsB32
-AagsB64 = _oboron.AagsB64
-AagsHex = _oboron.AagsHex
-
-# Aasv variants
-AasvC32 = _oboron.AasvC32
-AasvB32 = _oboron.AasvB32
-AasvB64 = _oboron.AasvB64
-AasvHex = _oboron.AasvHex
-
-# Apgs variants
-ApgsC32 = _oboron.ApgsC32
-ApgsB32 = _oboron.ApgsB32
-ApgsB64 = _oboron.ApgsB64
-ApgsHex = _oboron.ApgsHex
-
-# Apsv variants
-ApsvC32 = _oboron.ApsvC32
-ApsvB32 = _oboron.ApsvB32
-ApsvB64 = _oboron.ApsvB64
-ApsvHex = _oboron.ApsvHex
-
-# Upbc variants
-UpbcC32 = _oboron.UpbcC32
-UpbcB32 = _oboron.UpbcB32
-UpbcB64 = _oboron.UpbcB64
-UpbcHex = _oboron.UpbcHex
-
-# Mock1 (testing)
-Mock1C32 = _oboron.Mock1C32
-Mock1B32 = _oboron.Mock1B32
-Mock1B64 = _oboron.Mock1B64
-Mock1Hex = _oboron.Mock1Hex
-
-# Mock2 (testing)
-Mock2C32 = _oboron.Mock2C32
-Mock2B32 = _oboron.Mock2B32
-Mock2B64 = _oboron.Mock2B64
-Mock2Hex = _oboron.Mock2Hex
-
-# Utility functions
-generate_key = _oboron.generate_key
-generate_key_hex = _oboron.generate_key_hex
-generate_key_bytes = _oboron.generate_key_bytes
-
-generate_secret = _oboron.generate_secret
-generate_secret_hex = _oboron.generate_secret_hex
-generate_secret_bytes = _oboron.generate_secret_bytes
-
-# Convenience functions
-enc = _oboron.enc
-dec = _oboron.dec
-autodec = _oboron.autodec
-enc_keyless = _oboron.enc_keyless
-dec_keyless = _oboron.dec_keyless
-autodec_keyless = _oboron.autodec_keyless
 
 # ============================================================================
-# __all__ export
+# Lazily re-export Rust classes and functions
 # ============================================================================
 
-__all__ = [
-    # Base classes
-    'OboronBase',
-    'ObtextCodec',
-
-    # Main interfaces
-    'Ob',
+# Codec classes, recognized by isinstance(obj, OboronBase): one fixed-format
+# class per scheme and encoding (e.g. 'AasvB64'), plus the flexible Ob
+_SCHEMES = ('Aags', 'Aasv', 'Apgs', 'Apsv', 'Upbc', 'Mock1', 'Mock2')
+# Experimental: only in extensions built with the `apae` feature
+if hasattr(_oboron, 'ApaeC32'):
+    _SCHEMES += ('Apae',)
+_ENCODINGS = ('C32', 'B32', 'B64', 'Hex')
+_NAMES = tuple(
+    scheme + encoding for scheme, encoding in product(_SCHEMES, _ENCODINGS)
+) + ('Ob',)
+_NAMES_SET = frozenset(_NAMES)
+OboronBase._codec_names = _NAMES_SET
+
+# Other names re-exported from the Rust extension as-is
+_EXPORTS = (
+    # Multi-format interface
     'Omnib',
 
-    # Aags
-    'AagsC32',
-    'AagsB32',
-    'AagsB64',
-    'AagsHex',
-
-    # Aasv
-    'AasvC32',
-    'AasvB32',
-    'AasvB64',
-    'AasvHex',
-
-    # Apgs
-    'ApgsC32',
-    'ApgsB32',
-    'ApgsB64',
-    'ApgsHex',
-
-    # Apsv
-    'ApsvC32',
-    'ApsvB32',
-    'ApsvB64',
-    'ApsvHex',
-
-    # Upbc
-    'UpbcC32',
-    'UpbcB32',
-    'UpbcB64',
-    'UpbcHex',
-
-    # Mock1 (testing)
-    'Mock1C32',
-    'Mock1B32',
-    'Mock1B64',
-    'Mock1Hex',
-
-    # Mock2 (testing)
-    'Mock2C32',
-    'Mock2B32',
-    'Mock2B64',
-    'Mock2Hex',
-
-    # Format constants module
-    'formats',
-
     # Utility functions
     'generate_key',
     'generate_key_hex',
     'generate_key_bytes',
+    'generate_keys',
 
     'generate_secret',
     'generate_secret_hex',
@@ -281,4 +181,82 @@ __all__ = [
     'enc_keyless',
     'dec_keyless',
     'autodec_keyless',
-]
+)
+_LAZY_NAMES = _NAMES_SET | frozenset(_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve re-exported names from the Rust extension on first access (PEP 562)."""
+    if name in _LAZY_NAMES:
+        obj = getattr(_oboron, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# ============================================================================
+# Factory function
+# ============================================================================
+
+# Format string -> fixed-format codec class name (e.g. "aasv.b64" -> "AasvB64"),
+# built once at import so new() dispatches with a single dict lookup.  Keys are
+# interned like the `formats` constants, so passing a constant hits on identity.
+_FORMAT_CLASSES = {
+    sys.intern(f"{name[:-3].lower()}.{name[-3:].lower()}"): name
+    for name in _NAMES if name != 'Ob'
+}
+# Format members (and their int ids) dispatch through the same table.
+_FORMAT_CLASSES.update({
+    formats.Format[f"{name[:-3].upper()}_{name[-3:].upper()}"]: name
+    for name in _NAMES if name != 'Ob'
+})
+
+
+def new(format: Union[str, formats.Format], key: Optional[str] = None,
+        keyless: bool = False) -> OboronBase:
+    """
+    Create the fixed-format codec class instance for a format string.
+
+    Python counterpart of Rust's `oboron::new()`: the format is resolved
+    once, and the returned object is the dedicated class for that format
+    (e.g. `AasvB64` for "aasv.b64").  `format` may also be a
+    `formats.Format` member.  Use `Ob` instead if the format needs to
+    change after construction.
+
+    Example:
+        >>> cipher = new(formats.AASV_B64, key=key)
+        >>> type(cipher).__name__
+        'AasvB64'
+
+    Raises:
+        ValueError: If format is not a known fixed format.
+    """
+    try:
+        name = _FORMAT_CLASSES[format]
+    except (KeyError, TypeError):  # TypeError: unhashable format
+        raise ValueError(f"Unknown format: {format!r}") from None
+    cls = globals().get(name) or __getattr__(name)
+    return cls(key=key, keyless=keyless)
+
+
+# ============================================================================
+# __all__ export
+# ============================================================================
+
+__all__ = (
+    # Base classes
+    'OboronBase',
+    'ObtextCodec',
+    'ObtextBatchCodec',
+
+    # Format constants module
+    'formats',
+
+    # Factory function
+    'new',
+) + _EXPORTS + _NAMES
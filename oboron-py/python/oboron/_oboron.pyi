@@ -5,7 +5,7 @@ These stubs enable IDE autocompletion (VS Code, PyCharm), mypy, and pyright
 support for the oboron Python bindings.
 """
 
-from typing import Optional
+from typing import List, Optional, Union
 
 __version__: str
 
@@ -17,6 +17,12 @@ class AagsC32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -35,6 +41,12 @@ class AagsB32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -53,6 +65,12 @@ class AagsB64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -71,6 +89,12 @@ class AagsHex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -89,6 +113,12 @@ class AasvC32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -107,6 +137,12 @@ class AasvB32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -125,6 +161,12 @@ class AasvB64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -143,6 +185,12 @@ class AasvHex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -161,6 +209,12 @@ class ApgsC32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -179,6 +233,12 @@ class ApgsB32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -197,6 +257,12 @@ class ApgsB64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -215,6 +281,12 @@ class ApgsHex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -233,6 +305,12 @@ class ApsvC32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -251,6 +329,12 @@ class ApsvB32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -269,6 +353,12 @@ class ApsvB64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -287,6 +377,12 @@ class ApsvHex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -305,6 +401,12 @@ class UpbcC32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -323,6 +425,12 @@ class UpbcB32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -341,6 +449,12 @@ class UpbcB64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -359,6 +473,109 @@ class UpbcHex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def scheme(self) -> str: ...
+    @property
+    def encoding(self) -> str: ...
+    @property
+    def key(self) -> str: ...
+    @property
+    def key_hex(self) -> str: ...
+    @property
+    def key_bytes(self) -> bytes: ...
+    def __repr__(self) -> str: ...
+
+# Experimental: only in builds with the `apae` feature
+class ApaeC32:
+    def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def enc(self, plaintext: str) -> str: ...
+    def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def scheme(self) -> str: ...
+    @property
+    def encoding(self) -> str: ...
+    @property
+    def key(self) -> str: ...
+    @property
+    def key_hex(self) -> str: ...
+    @property
+    def key_bytes(self) -> bytes: ...
+    def __repr__(self) -> str: ...
+
+class ApaeB32:
+    def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def enc(self, plaintext: str) -> str: ...
+    def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def scheme(self) -> str: ...
+    @property
+    def encoding(self) -> str: ...
+    @property
+    def key(self) -> str: ...
+    @property
+    def key_hex(self) -> str: ...
+    @property
+    def key_bytes(self) -> bytes: ...
+    def __repr__(self) -> str: ...
+
+class ApaeB64:
+    def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def enc(self, plaintext: str) -> str: ...
+    def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def scheme(self) -> str: ...
+    @property
+    def encoding(self) -> str: ...
+    @property
+    def key(self) -> str: ...
+    @property
+    def key_hex(self) -> str: ...
+    @property
+    def key_bytes(self) -> bytes: ...
+    def __repr__(self) -> str: ...
+
+class ApaeHex:
+    def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def enc(self, plaintext: str) -> str: ...
+    def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -381,6 +598,12 @@ class ZrbcxC32:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -399,6 +622,12 @@ class ZrbcxB32:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -417,6 +646,12 @@ class ZrbcxB64:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -435,6 +670,12 @@ class ZrbcxHex:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -454,9 +695,15 @@ class ZrbcxHex:
 # ============================================================================
 
 class Ob:
-    def __init__(self, format: str, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def __init__(self, format: Union[str, int], key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     def autodec(self, obtext: str) -> str: ...
     @property
     def format(self) -> str: ...
@@ -470,7 +717,7 @@ class Ob:
     def key_hex(self) -> str: ...
     @property
     def key_bytes(self) -> bytes: ...
-    def set_format(self, format: str) -> None: ...
+    def set_format(self, format: Union[str, int]) -> None: ...
     def set_scheme(self, scheme: str) -> None: ...
     def set_encoding(self, encoding: str) -> None: ...
     def __repr__(self) -> str: ...
@@ -489,9 +736,15 @@ class Omnib:
     def __repr__(self) -> str: ...
 
 class Obz:
-    def __init__(self, format: str, key: Optional[str] = None, keyless: bool = False) -> None: ...
+    def __init__(self, format: Union[str, int], key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     def autodec(self, obtext: str) -> str: ...
     @property
     def format(self) -> str: ...
@@ -505,7 +758,7 @@ class Obz:
     def secret_hex(self) -> str: ...
     @property
     def secret_bytes(self) -> bytes: ...
-    def set_format(self, format: str) -> None: ...
+    def set_format(self, format: Union[str, int]) -> None: ...
     def set_scheme(self, scheme: str) -> None: ...
     def set_encoding(self, encoding: str) -> None: ...
     def __repr__(self) -> str: ...
@@ -531,6 +784,12 @@ class Mock1C32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -549,6 +808,12 @@ class Mock1B32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -567,6 +832,12 @@ class Mock1B64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -585,6 +856,12 @@ class Mock1Hex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -603,6 +880,12 @@ class Mock2C32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -621,6 +904,12 @@ class Mock2B32:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -639,6 +928,12 @@ class Mock2B64:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -657,6 +952,12 @@ class Mock2Hex:
     def __init__(self, key: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -679,6 +980,12 @@ class Zmock1C32:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -697,6 +1004,12 @@ class Zmock1B32:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -715,6 +1028,12 @@ class Zmock1B64:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -733,6 +1052,12 @@ class Zmock1Hex:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -755,6 +1080,12 @@ class Legacy:
     def __init__(self, secret: Optional[str] = None, keyless: bool = False) -> None: ...
     def enc(self, plaintext: str) -> str: ...
     def dec(self, obtext: str) -> str: ...
+    def enc_many(self, plaintexts: List[str]) -> List[str]: ...
+    def dec_many(self, obtexts: List[str]) -> List[str]: ...
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes: ...
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int: ...
+    def max_output_len(self, plaintext_len: int) -> int: ...
     @property
     def format(self) -> str: ...
     @property
@@ -776,6 +1107,7 @@ class Legacy:
 def generate_key() -> str: ...
 def generate_key_hex() -> str: ...
 def generate_key_bytes() -> bytes: ...
+def generate_keys(n: int) -> List[bytes]: ...
 def generate_secret() -> str: ...
 def generate_secret_hex() -> str: ...
 def generate_secret_bytes() -> bytes: ...
@@ -1,7 +1,7 @@
 """Format string constants for Oboron. 
 
 All constants follow the pattern:  {SCHEME}_{ENCODING}
-- Schemes: AAGS, AASV, APGS, APSV, UPBC, ZRBCX, LEGACY, MOCK1, MOCK2
+- Schemes: AAGS, AASV, APGS, APSV, UPBC, ZRBCX, LEGACY, MOCK1, MOCK2, ZMOCK1, APAE (experimental)
 - Encodings:
   - B32 (RFC 4648 base32),
   - B64 (RFC 4648 base64url),
@@ -14,74 +14,133 @@ Example:
     >>> 
     >>> ob = Ob(formats.AASV_B64, key)
     >>> ot = ob.enc("secret")
+
+The constants are created on first access (PEP 562) and interned with
+`sys.intern`, so dict lookups keyed by format strings (e.g. in
+`oboron.new()`) hit on identity when a constant is passed.
+
+The same formats are also available as members of the `Format` integer
+enum, whose values are `scheme_id << 8 | encoding_id`.  `Ob`, `Obz` and
+`oboron.new()` accept a member wherever a format string is accepted and
+resolve it by id, without parsing a string:
+
+    >>> ob = Ob(formats.Format.AASV_B64, key)
+    >>> str(formats.Format.AASV_B64)
+    'aasv.b64'
 """
 
-# aags - deterministic AES-GCM-SIV (secure and authenticated)
-AAGS_B32: str = "aags.b32"
-AAGS_B64: str = "aags.b64"
-AAGS_C32: str = "aags.c32"
-AAGS_HEX: str = "aags.hex"
-
-# aasv - deterministic AES-SIV (secure and authenticated, nonce-misuse resistant)
-AASV_B32: str = "aasv.b32"
-AASV_B64: str = "aasv.b64"
-AASV_C32: str = "aasv.c32"
-AASV_HEX: str = "aasv.hex"
-
-# apgs - probabilistic AES-GCM-SIV (secure and authenticated)
-APGS_B32: str = "apgs.b32"
-APGS_B64: str = "apgs.b64"
-APGS_C32: str = "apgs.c32"
-APGS_HEX: str = "apgs.hex"
-
-# apsv - probabilistic AES-SIV (secure and authenticated)
-APSV_B32: str = "apsv.b32"
-APSV_B64: str = "apsv.b64"
-APSV_C32: str = "apsv.c32"
-APSV_HEX: str = "apsv.hex"
-
-# upbc - probabilistic AES-CBC (secure but not authenticated)
-UPBC_B32: str = "upbc.b32"
-UPBC_B64: str = "upbc.b64"
-UPBC_C32: str = "upbc.c32"
-UPBC_HEX: str = "upbc.hex"
-
-# zrbcx - deterministic AES-CBC (insecure - obfuscation only)
-ZRBCX_B32: str = "zrbcx.b32"
-ZRBCX_B64: str = "zrbcx.b64"
-ZRBCX_C32: str = "zrbcx.c32"
-ZRBCX_HEX: str = "zrbcx.hex"
-
-# Testing schemes (no encryption)
-MOCK1_B32: str = "mock1.b32"
-MOCK1_B64: str = "mock1.b64"
-MOCK1_C32: str = "mock1.c32"
-MOCK1_HEX: str = "mock1.hex"
-
-MOCK2_B32: str = "mock2.b32"
-MOCK2_B64: str = "mock2.b64"
-MOCK2_C32: str = "mock2.c32"
-MOCK2_HEX: str = "mock2.hex"
-
-# Legacy (legacy - insecure - obfuscation only; backwards compatibility only - use zrbcx instead)
-LEGACY: str = "legacy"
-
-__all__ = [
-    # aags
-    "AAGS_B32", "AAGS_B64", "AAGS_C32", "AAGS_HEX",
-    # aasv
-    "AASV_B32", "AASV_B64", "AASV_C32", "AASV_HEX",
-    # apgs
-    "APGS_B32", "APGS_B64", "APGS_C32", "APGS_HEX",
-    # apsv
-    "APSV_B32", "APSV_B64", "APSV_C32", "APSV_HEX",
-    # zrbcx
-    "ZRBCX_B32", "ZRBCX_B64", "ZRBCX_C32", "ZRBCX_HEX",
-    # upbc
-    "UPBC_B32", "UPBC_B64", "UPBC_C32", "UPBC_HEX",
-    # Legacy
-    "LEGACY",
-    # Testing
-    "MOCK1_B32", "MOCK1_B64", "MOCK1_C32", "MOCK1_HEX",
-    "MOCK2_B32", "MOCK2_B64", "MOCK2_C32", "MOCK2_HEX",
-]
+import sys
+from enum import IntEnum
+from itertools import product
+
+_SCHEMES = (
+    "aags",   # deterministic AES-GCM-SIV (secure and authenticated)
+    "aasv",   # deterministic AES-SIV (secure and authenticated, nonce-misuse resistant)
+    "apgs",   # probabilistic AES-GCM-SIV (secure and authenticated)
+    "apsv",   # probabilistic AES-SIV (secure and authenticated)
+    "upbc",   # probabilistic AES-CBC (secure but not authenticated)
+    "zrbcx",  # deterministic AES-CBC (insecure - obfuscation only)
+    "mock1",  # testing (no encryption)
+    "mock2",  # testing (no encryption)
+    "zmock1",  # z-tier testing (no encryption)
+    "apae",   # probabilistic AEGIS-128L (experimental, `apae` feature)
+)
+_ENCODINGS = ("b32", "b64", "c32", "hex")
+
+# Constant name -> format string, e.g. "AASV_B64" -> "aasv.b64"
+_TABLE = {
+    f"{scheme}_{encoding}".upper(): f"{scheme}.{encoding}"
+    for scheme, encoding in product(_SCHEMES, _ENCODINGS)
+}
+# Legacy (insecure - obfuscation only; backwards compatibility only - use zrbcx instead)
+_TABLE["LEGACY"] = "legacy"
+
+
+def __getattr__(name):
+    """Create and intern a format string constant on first access (PEP 562)."""
+    try:
+        value = sys.intern(_TABLE[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# Format id layout: scheme_id << 8 | encoding_id.  This is the one place the
+# ids are documented; `format_from_id` in the Rust bindings decodes the same
+# table, so change both together.
+#
+#   scheme_id:   1 aags    2 aasv    3 apgs    4 apsv    5 upbc
+#                6 zrbcx   7 mock1   8 mock2   9 zmock1  10 legacy
+#               11 apae
+#   encoding_id: 0 c32     1 b32     2 b64     3 hex
+#
+# legacy has a single format, which uses the b32 encoding id.
+
+class Format(IntEnum):
+    """Format ids (see the layout above); `str()` gives the format string."""
+
+    AAGS_C32 = 0x0100
+    AAGS_B32 = 0x0101
+    AAGS_B64 = 0x0102
+    AAGS_HEX = 0x0103
+
+    AASV_C32 = 0x0200
+    AASV_B32 = 0x0201
+    AASV_B64 = 0x0202
+    AASV_HEX = 0x0203
+
+    APGS_C32 = 0x0300
+    APGS_B32 = 0x0301
+    APGS_B64 = 0x0302
+    APGS_HEX = 0x0303
+
+    APSV_C32 = 0x0400
+    APSV_B32 = 0x0401
+    APSV_B64 = 0x0402
+    APSV_HEX = 0x0403
+
+    UPBC_C32 = 0x0500
+    UPBC_B32 = 0x0501
+    UPBC_B64 = 0x0502
+    UPBC_HEX = 0x0503
+
+    ZRBCX_C32 = 0x0600
+    ZRBCX_B32 = 0x0601
+    ZRBCX_B64 = 0x0602
+    ZRBCX_HEX = 0x0603
+
+    MOCK1_C32 = 0x0700
+    MOCK1_B32 = 0x0701
+    MOCK1_B64 = 0x0702
+    MOCK1_HEX = 0x0703
+
+    MOCK2_C32 = 0x0800
+    MOCK2_B32 = 0x0801
+    MOCK2_B64 = 0x0802
+    MOCK2_HEX = 0x0803
+
+    ZMOCK1_C32 = 0x0900
+    ZMOCK1_B32 = 0x0901
+    ZMOCK1_B64 = 0x0902
+    ZMOCK1_HEX = 0x0903
+
+    LEGACY = 0x0a01
+
+    APAE_C32 = 0x0b00
+    APAE_B32 = 0x0b01
+    APAE_B64 = 0x0b02
+    APAE_HEX = 0x0b03
+
+    def __str__(self) -> str:
+        return globals().get(self.name) or __getattr__(self.name)
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+
+__all__ = ("Format",) + tuple(_TABLE)
@@ -1,6 +1,9 @@
 """Test that inheritance works correctly."""
 
+import sys
+
 import oboron
+import oboron.ztier
 
 
 def test_isinstance_checks():
@@ -24,6 +27,44 @@ def test_isinstance_checks():
     print("✓ All isinstance checks passed!")
 
 
+def test_new_factory():
+    """Test that new() returns the fixed-format class for a format."""
+    key = oboron.generate_key()
+
+    aasv_b64 = oboron.new(oboron.formats.AASV_B64, key=key)
+    assert isinstance(aasv_b64, oboron.AasvB64)
+    assert isinstance(aasv_b64, oboron.OboronBase)
+
+    for bad in ("aasv.b65", "ob", ["aasv.b64"]):
+        try:
+            oboron.new(bad, key=key)
+            assert False, f"expected ValueError for {bad!r}"
+        except ValueError:
+            pass
+
+    print("✓ new() factory test passed!")
+
+
+def test_subclass_does_not_claim_codecs():
+    """Test that a Python subclass of a base class does not match native codecs."""
+    class MyCodec(oboron.OboronBase):
+        pass
+
+    class MyZtierCodec(oboron.ztier.ZtierBase):
+        pass
+
+    aasv = oboron.AasvB64(key=oboron.generate_key())
+    zrbcx = oboron.ztier.ZrbcxB64(secret=oboron.generate_secret())
+
+    assert not isinstance(aasv, MyCodec)
+    assert not issubclass(oboron.AasvB64, MyCodec)
+    assert not isinstance(zrbcx, MyZtierCodec)
+    assert isinstance(MyCodec(), oboron.OboronBase)
+    assert isinstance(MyZtierCodec(), oboron.ztier.ZtierBase)
+
+    print("✓ Subclass check test passed!")
+
+
 def test_polymorphic_function():
     """Test that we can write generic functions over OboronBase."""
     def encrypt_with_cipher(cipher: oboron.OboronBase, data: str) -> str:
@@ -46,6 +87,117 @@ def test_polymorphic_function():
     print("✓ Polymorphic function test passed!")
 
 
+def _codec_cases():
+    """Return (format, codec) for every codec class in the build, plus Ob and Obz."""
+    key = oboron.generate_key()
+    secret = oboron.generate_secret()
+
+    cases = [
+        (fmt, getattr(oboron, name)(key=key))
+        for fmt, name in oboron._FORMAT_CLASSES.items() if isinstance(fmt, str)
+    ]
+    for name in oboron.ztier._NAMES:
+        if name == 'Obz':
+            continue
+        fmt = ("legacy" if name == 'Legacy'
+               else f"{name[:-3].lower()}.{name[-3:].lower()}")
+        cases.append((fmt, getattr(oboron.ztier, name)(secret=secret)))
+    Format = oboron.formats.Format
+    cases.append(("aasv.b64", oboron.Ob(Format.AASV_B64, key=key)))
+    cases.append(("zrbcx.b64", oboron.ztier.Obz(Format.ZRBCX_B64, key=secret)))
+    return cases
+
+
+def test_codec_methods():
+    """Test the methods every codec class shares, across all codec classes."""
+    plaintexts = ["alpha", "beta", "gamma"]
+
+    for fmt, codec in _codec_cases():
+        label = f"{type(codec).__name__} ({fmt})"
+
+        # enc_many/dec_many round-trip like the scalar API
+        obtexts = codec.enc_many(plaintexts)
+        assert [codec.dec(ot) for ot in obtexts] == plaintexts, label
+        assert codec.dec_many(obtexts) == plaintexts, label
+        assert codec.enc_many([]) == [], label
+
+        # enc_bytes/dec_bytes round-trip like the str API
+        ot = codec.enc_bytes(b"hello")
+        assert codec.dec(ot.decode("ascii")) == "hello", label
+        assert codec.dec_bytes(ot) == b"hello", label
+        assert codec.dec_bytes(bytearray(ot)) == b"hello", label
+        assert codec.dec_bytes(memoryview(ot)) == b"hello", label
+        for data in (bytearray(b"hello"), memoryview(b"hello")):
+            assert codec.dec_bytes(codec.enc_bytes(data)) == b"hello", label
+        try:
+            codec.enc_bytes(memoryview(b"hheelllloo")[::2])  # not contiguous
+            assert False, f"expected ValueError for {label}"
+        except ValueError:
+            pass
+
+        # enc_into writes into a reused buffer sized by max_output_len
+        out = bytearray(codec.max_output_len(len(b"hello")))
+        n = codec.enc_into(b"hello", out)
+        assert codec.dec_bytes(out[:n]) == b"hello", label
+        n = codec.enc_into(memoryview(b"hello"), out)
+        assert codec.dec_bytes(memoryview(out)[:n]) == b"hello", label
+        try:
+            codec.enc_into(b"hello", bytearray(n - 1))
+            assert False, f"expected ValueError for {label}"
+        except ValueError:
+            pass
+
+        # format/scheme/encoding, and the matching formats constant and member
+        scheme, _, encoding = fmt.partition(".")
+        assert codec.format == fmt, label
+        assert codec.scheme == scheme, label
+        assert codec.encoding == (encoding or "b32"), label
+        member = oboron.formats.Format[fmt.replace(".", "_").upper()]
+        assert str(member) is getattr(oboron.formats, member.name), label
+        assert f"{member}" == fmt, label
+        if isinstance(codec, (oboron.Ob, oboron.ztier.Obz)):
+            continue
+        # Fixed-format getters hand out the shared interned constants
+        assert codec.format is codec.format, label
+        assert codec.format is getattr(oboron.formats, member.name), label
+
+    print("✓ Codec methods test passed!")
+
+
+def test_ob_set_format():
+    """Test that Ob accepts Format members wherever format strings are accepted."""
+    key = oboron.generate_key()
+    fmt = oboron.formats.Format.AASV_B64
+
+    ob = oboron.Ob(fmt, key=key)
+    assert ob.enc("hello") == oboron.Ob("aasv.b64", key=key).enc("hello")
+    ob.set_format(oboron.formats.Format.APSV_HEX)
+    assert ob.format == "apsv.hex"
+
+    assert type(oboron.new(fmt, key=key)).__name__ == "AasvB64"
+
+    print("✓ Ob set_format test passed!")
+
+
+def test_generate_keys():
+    """Test batch key generation."""
+    keys = oboron.generate_keys(4)
+
+    assert len(keys) == 4
+    assert all(isinstance(k, bytes) and len(k) == 64 for k in keys)
+    assert len(set(keys)) == 4
+    assert oboron.generate_keys(0) == []
+
+    # n * 64 bytes overflows (or cannot be allocated): an error, not a crash
+    try:
+        oboron.generate_keys(sys.maxsize)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Batch key generation test passed!")
+
+
 def test_omnib_operations():
     """Test Omnib multi-format operations."""
     key = oboron.generate_key()
@@ -64,6 +216,11 @@ def test_omnib_operations():
 
 if __name__ == "__main__":
     test_isinstance_checks()
+    test_new_factory()
+    test_subclass_does_not_claim_codecs()
     test_polymorphic_function()
+    test_codec_methods()
+    test_ob_set_format()
+    test_generate_keys()
     test_omnib_operations()
     print("\n✅ All tests passed!")
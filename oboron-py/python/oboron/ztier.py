@@ -1,13 +1,14 @@
-from abc import ABC, abstractmethod
-from . import _oboron
+from itertools import product
+from typing import List, Union
+from . import _oboron, _CodecMeta, _ENCODINGS
 
 
-class ZtierBase(ABC):
+class ZtierBase(metaclass=_CodecMeta):
     """
-    Abstract base class for all Z-tier codec implementations.
+    Base class for all Z-tier codec implementations.
 
-    All Z-tier cipher classes (ZrbcxC32, ZrbcxB32, etc.) are registered as
-    virtual subclasses, enabling isinstance() and issubclass() checks.
+    All Z-tier cipher classes (ZrbcxC32, ZrbcxB32, etc.) are recognized by
+    isinstance() and issubclass() checks.
 
     Example:
         >>> cipher = ZrbcxC32(secret=secret)
@@ -18,129 +19,106 @@ class ZtierBase(ABC):
         ...     return cipher.enc("hello")
     """
 
-    @abstractmethod
     def enc(self, plaintext: str) -> str:
         """Encrypt and encode plaintext to obtext."""
         ...
 
-    @abstractmethod
     def dec(self, obtext: str) -> str:
         """Decode and decrypt obtext to plaintext."""
         ...
 
+    def enc_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt and encode a batch of plaintexts in a single call."""
+        ...
+
+    def dec_many(self, obtexts: List[str]) -> List[str]:
+        """Decode and decrypt a batch of obtexts in a single call."""
+        ...
+
+    def enc_bytes(self, plaintext: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Encrypt and encode UTF-8 plaintext bytes to ASCII obtext bytes."""
+        ...
+
+    def dec_bytes(self, obtext: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Decode and decrypt ASCII obtext bytes to UTF-8 plaintext bytes."""
+        ...
+
+    def enc_into(self, plaintext: Union[bytes, bytearray, memoryview], out: bytearray) -> int:
+        """Encrypt and encode UTF-8 plaintext bytes into `out`; return the length written."""
+        ...
+
+    def max_output_len(self, plaintext_len: int) -> int:
+        """Get the `out` size `enc_into()` needs for a plaintext of this many bytes."""
+        ...
+
     @property
-    @abstractmethod
     def format(self) -> str:
         """Get the format identifier (e.g., 'zrbcx.b64')."""
         ...
 
     @property
-    @abstractmethod
     def scheme(self) -> str:
         """Get the scheme identifier (e.g., 'zrbcx')."""
         ...
 
     @property
-    @abstractmethod
     def encoding(self) -> str:
         """Get the encoding format (e.g., 'c32')."""
         ...
 
     @property
-    @abstractmethod
     def secret(self) -> str:
         """Get the encryption secret as a base64 string."""
         ...
 
     @property
-    @abstractmethod
     def secret_hex(self) -> str:
         """Get the encryption secret as a hex string."""
         ...
 
     @property
-    @abstractmethod
     def secret_bytes(self) -> bytes:
         """Get the encryption secret as raw bytes."""
         ...
 
-
-# ============================================================================
-# Register all Rust classes as virtual subclasses
-# ============================================================================
-
-# Zrbcx variants
-ZtierBase.register(_oboron.ZrbcxC32)
-ZtierBase.register(_oboron.ZrbcxB32)
-ZtierBase.register(_oboron.ZrbcxB64)
-ZtierBase.register(_oboron.ZrbcxHex)
-
-# Legacy variant
-ZtierBase.register(_oboron.Legacy)
-
-# Zmock1 variants
-ZtierBase.register(_oboron.Zmock1C32)
-ZtierBase.register(_oboron.Zmock1B32)
-ZtierBase.register(_oboron.Zmock1B64)
-ZtierBase.register(_oboron.Zmock1Hex)
-
-# Flexible interface
-ZtierBase.register(_oboron.Obz)
+    _codec_names = frozenset()
 
 
 # ============================================================================
-# Re-export all classes and functions
+# Lazily re-export Rust classes and functions
 # ============================================================================
 
-# Z-tier interfaces
-Obz = _oboron.Obz
-Omnibz = _oboron.Omnibz
-
-# Zrbcx variants
-ZrbcxC32 = _oboron.ZrbcxC32
-ZrbcxB32 = _oboron.ZrbcxB32
-ZrbcxB64 = _oboron.ZrbcxB64
-ZrbcxHex = _oboron.ZrbcxHex
+# Codec classes, recognized by isinstance(obj, ZtierBase)
+_NAMES = tuple(
+    scheme + encoding for scheme, encoding in product(('Zrbcx', 'Zmock1'), _ENCODINGS)
+) + ('Legacy', 'Obz')
+ZtierBase._codec_names = frozenset(_NAMES)
 
-# Legacy variant
-Legacy = _oboron.Legacy
-
-# Zmock1 (testing)
-Zmock1C32 = _oboron.Zmock1C32
-Zmock1B32 = _oboron.Zmock1B32
-Zmock1B64 = _oboron.Zmock1B64
-Zmock1Hex = _oboron.Zmock1Hex
+# Other names re-exported from the Rust extension as-is
+_EXPORTS = (
+    # Multi-format z-tier interface
+    'Omnibz',
 
-# Utility functions
-generate_secret = _oboron.generate_secret
-generate_secret_hex = _oboron.generate_secret_hex
-generate_secret_bytes = _oboron.generate_secret_bytes
+    # Utility functions
+    'generate_secret',
+    'generate_secret_hex',
+    'generate_secret_bytes',
+)
+_LAZY_NAMES = ZtierBase._codec_names | frozenset(_EXPORTS)
 
-__all__ = [
-    # Base class
-    'ZtierBase',
 
-    # Z-tier interfaces
-    'Obz',
-    'Omnibz',
+def __getattr__(name):
+    """Resolve re-exported names from the Rust extension on first access (PEP 562)."""
+    if name in _LAZY_NAMES:
+        obj = getattr(_oboron, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = obj
+    return obj
 
-    # Zrbcx
-    'ZrbcxC32',
-    'ZrbcxB32',
-    'ZrbcxB64',
-    'ZrbcxHex',
 
-    # Legacy
-    'Legacy',
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-    # Zmock1
-    'Zmock1C32',
-    'Zmock1B32',
-    'Zmock1B64',
-    'Zmock1Hex',
 
-    # Utility functions
-    'generate_secret',
-    'generate_secret_hex',
-    'generate_secret_bytes',
-]
+__all__ = ('ZtierBase',) + _EXPORTS + _NAMES
@@ -1,19 +1,293 @@
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyByteArray, PyBytes, PyString};
+
+/// Interpret a bytes-like argument as UTF-8 text without creating a Python `str`.
+fn utf8_arg<'a>(data: &'a [u8], op: &str) -> PyResult<&'a str> {
+    std::str::from_utf8(data)
+        .map_err(|_| PyValueError::new_err(format!("{} operation failed: invalid UTF-8", op)))
+}
+
+/// Borrow a bytes-like argument (any C-contiguous buffer of bytes) without copying it.
+///
+/// The slice is valid while `buf` is alive: the exporter cannot resize or free
+/// the memory while the buffer is held.
+fn buffer_arg<'a>(buf: &'a PyBuffer<u8>, op: &str) -> PyResult<&'a [u8]> {
+    if !buf.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!(
+            "{} operation failed: buffer is not C-contiguous",
+            op
+        )));
+    }
+    if buf.len_bytes() == 0 {
+        return Ok(&[]);
+    }
+    // SAFETY: the buffer holds `len_bytes()` contiguous `u8` items starting at
+    // `buf_ptr()`, and stays exported for the lifetime of the borrow.
+    Ok(unsafe { std::slice::from_raw_parts(buf.buf_ptr() as *const u8, buf.len_bytes()) })
+}
+
+/// Copy `data` to the start of a caller-provided `bytearray`, returning its length.
+fn write_into(out: &Bound<'_, PyByteArray>, data: &[u8]) -> PyResult<usize> {
+    // SAFETY: no Python code runs while the slice is borrowed, so the
+    // bytearray cannot be resized under it.
+    let buf = unsafe { out.as_bytes_mut() };
+    if buf.len() < data.len() {
+        return Err(PyValueError::new_err(format!(
+            "Output buffer too small: {} bytes needed, {} available",
+            data.len(),
+            buf.len()
+        )));
+    }
+    buf[..data.len()].copy_from_slice(data);
+    Ok(data.len())
+}
+
+/// Resolve an integer format id (`scheme_id << 8 | encoding_id`, the values of
+/// `oboron.formats.Format`) without going through the format string.
+///
+/// The id table is documented above `Format` in `formats.py`; keep the two in sync.
+fn format_from_id(id: u16) -> Result<::oboron::Format, ::oboron::Error> {
+    use ::oboron::{Encoding, Error, Format, Scheme};
+
+    let encoding = match id & 0xff {
+        0 => Encoding::C32,
+        1 => Encoding::B32,
+        2 => Encoding::B64,
+        3 => Encoding::Hex,
+        _ => return Err(Error::InvalidFormat),
+    };
+    let scheme = match id >> 8 {
+        #[cfg(feature = "aags")]
+        1 => Scheme::Aags,
+        #[cfg(feature = "aasv")]
+        2 => Scheme::Aasv,
+        #[cfg(feature = "apgs")]
+        3 => Scheme::Apgs,
+        #[cfg(feature = "apsv")]
+        4 => Scheme::Apsv,
+        #[cfg(feature = "upbc")]
+        5 => Scheme::Upbc,
+        #[cfg(feature = "zrbcx")]
+        6 => Scheme::Zrbcx,
+        #[cfg(feature = "mock")]
+        7 => Scheme::Mock1,
+        #[cfg(feature = "mock")]
+        8 => Scheme::Mock2,
+        #[cfg(feature = "zmock")]
+        9 => Scheme::Zmock1,
+        // Legacy has a single format, "legacy"
+        #[cfg(feature = "legacy")]
+        10 if encoding == Encoding::B32 => Scheme::Legacy,
+        #[cfg(feature = "apae")]
+        11 => Scheme::Apae,
+        _ => return Err(Error::InvalidFormat),
+    };
+    Ok(Format::new(scheme, encoding))
+}
+
+/// Extract a format argument given either as a format string or as a
+/// `oboron.formats.Format` member (any `int` id).
+fn format_arg(format: &Bound<'_, PyAny>) -> PyResult<Result<::oboron::Format, ::oboron::Error>> {
+    match format.downcast::<PyString>() {
+        Ok(s) => Ok(::oboron::Format::from_str(s.to_str()?)),
+        Err(_) => Ok(format_from_id(format.extract()?)),
+    }
+}
+
+/// Interned Python strings for a fixed-format codec's format, scheme and encoding.
+///
+/// Built once per instance so the getters hand out the same `str` objects
+/// (shared with the constants in `oboron.formats`) instead of allocating.
+struct FormatNames {
+    format: Py<PyString>,
+    scheme: Py<PyString>,
+    encoding: Py<PyString>,
+}
+
+impl FormatNames {
+    fn new(py: Python, format: ::oboron::Format) -> Self {
+        Self {
+            format: PyString::intern_bound(py, &format.to_string()).unbind(),
+            scheme: PyString::intern_bound(py, format.scheme().as_str()).unbind(),
+            encoding: PyString::intern_bound(py, format.encoding().as_str()).unbind(),
+        }
+    }
+}
+
+/// Emit the `#[pymethods]` block for a codec class, followed by the methods
+/// every codec shares (batch, bytes and buffer variants of `enc`/`dec`).
+///
+/// `#[pymethods]` does not expand macros inside the impl block, so the shared
+/// methods are spliced in before the attribute runs.  They only need an
+/// `inner` field with `enc()`, `dec()` and `format()`.
+macro_rules! codec_pymethods {
+    ($py_name:ident { $($methods:tt)* }) => {
+        #[pymethods]
+        impl $py_name {
+            $($methods)*
+
+            /// Encrypt+encode a batch of plaintext strings.
+            ///
+            /// The whole batch is processed in a single call with the GIL released,
+            /// so the Python/Rust call overhead is paid once per batch, not per item.
+            ///
+            /// Args:
+            ///     plaintexts: The plaintext strings to encrypt+encode.
+            ///
+            /// Returns:
+            ///     The obtext strings, in input order.
+            ///
+            /// Raises:
+            ///     ValueError: If the enc operation fails for any item.
+            fn enc_many(&self, py: Python, plaintexts: Vec<String>) -> PyResult<Vec<String>> {
+                let inner = &self.inner;
+                let result = py.allow_threads(|| {
+                    plaintexts
+                        .iter()
+                        .map(|plaintext| inner.enc(plaintext))
+                        .collect::<Result<Vec<_>, _>>()
+                });
+                result.map_err(|e| PyValueError::new_err(format!("Enc operation failed: {}", e)))
+            }
+
+            /// Decode+decrypt a batch of obtext strings back to plaintext.
+            ///
+            /// The whole batch is processed in a single call with the GIL released.
+            ///
+            /// Args:
+            ///     obtexts: The encrypted+encoded strings to decode+decrypt.
+            ///
+            /// Returns:
+            ///     The decoded+decrypted plaintext strings, in input order.
+            ///
+            /// Raises:
+            ///     ValueError: If the dec operation fails for any item.
+            fn dec_many(&self, py: Python, obtexts: Vec<String>) -> PyResult<Vec<String>> {
+                let inner = &self.inner;
+                let result = py.allow_threads(|| {
+                    obtexts
+                        .iter()
+                        .map(|obtext| inner.dec(obtext))
+                        .collect::<Result<Vec<_>, _>>()
+                });
+                result.map_err(|e| PyValueError::new_err(format!("Dec operation failed: {}", e)))
+            }
+
+            /// Encrypt+encode a bytes-like plaintext, returning the obtext as bytes.
+            ///
+            /// Avoids the Python `str` round-trips on both sides of the call: the
+            /// plaintext is read in place through the buffer protocol, with the GIL
+            /// released, and the ASCII obtext is returned as `bytes`.
+            ///
+            /// Args:
+            ///     plaintext: The UTF-8 encoded plaintext (bytes, bytearray, memoryview
+            ///         or any other C-contiguous byte buffer).
+            ///
+            /// Returns:
+            ///     The obtext as ASCII bytes.
+            ///
+            /// Raises:
+            ///     ValueError: If the plaintext is not a C-contiguous buffer or not valid
+            ///         UTF-8, or the enc operation fails.
+            fn enc_bytes(&self, py: Python, plaintext: PyBuffer<u8>) -> PyResult<Py<PyBytes>> {
+                let plaintext = buffer_arg(&plaintext, "Enc")?;
+                let inner = &self.inner;
+                let obtext = py.allow_threads(|| {
+                    inner
+                        .enc(utf8_arg(plaintext, "Enc")?)
+                        .map_err(|e| PyValueError::new_err(format!("Enc operation failed: {}", e)))
+                })?;
+                Ok(PyBytes::new_bound(py, obtext.as_bytes()).into())
+            }
+
+            /// Decode+decrypt a bytes-like obtext, returning the plaintext as bytes.
+            ///
+            /// Args:
+            ///     obtext: The encrypted+encoded obtext as ASCII bytes (bytes, bytearray,
+            ///         memoryview or any other C-contiguous byte buffer).
+            ///
+            /// Returns:
+            ///     The decoded+decrypted plaintext as UTF-8 encoded bytes.
+            ///
+            /// Raises:
+            ///     ValueError: If the obtext is not a C-contiguous buffer or the dec operation
+            ///         fails.
+            fn dec_bytes(&self, py: Python, obtext: PyBuffer<u8>) -> PyResult<Py<PyBytes>> {
+                let obtext = buffer_arg(&obtext, "Dec")?;
+                let inner = &self.inner;
+                let plaintext = py.allow_threads(|| {
+                    inner
+                        .dec(utf8_arg(obtext, "Dec")?)
+                        .map_err(|e| PyValueError::new_err(format!("Dec operation failed: {}", e)))
+                })?;
+                Ok(PyBytes::new_bound(py, plaintext.as_bytes()).into())
+            }
+
+            /// Encrypt+encode a bytes-like plaintext into a preallocated `bytearray`.
+            ///
+            /// The obtext is copied to the start of `out` instead of being returned
+            /// as a new `bytes` object, so one buffer can be reused across calls.  It
+            /// is still built in a temporary Rust string first.  Size `out` with
+            /// `max_output_len()`.
+            ///
+            /// Args:
+            ///     plaintext: The UTF-8 encoded plaintext (bytes, bytearray, memoryview
+            ///         or any other C-contiguous byte buffer).
+            ///     out:       The output buffer, at least `max_output_len(len(plaintext))` bytes.
+            ///
+            /// Returns:
+            ///     The number of obtext bytes written to `out`.
+            ///
+            /// Raises:
+            ///     ValueError: If the plaintext is not a C-contiguous buffer or not valid
+            ///         UTF-8, the enc operation fails, or `out` is too small.
+            fn enc_into(
+                &self,
+                py: Python,
+                plaintext: PyBuffer<u8>,
+                out: &Bound<'_, PyByteArray>,
+            ) -> PyResult<usize> {
+                let plaintext = buffer_arg(&plaintext, "Enc")?;
+                let inner = &self.inner;
+                let obtext = py.allow_threads(|| {
+                    inner
+                        .enc(utf8_arg(plaintext, "Enc")?)
+                        .map_err(|e| PyValueError::new_err(format!("Enc operation failed: {}", e)))
+                })?;
+                write_into(out, obtext.as_bytes())
+            }
+
+            /// Upper bound on the obtext length for a plaintext of `plaintext_len` bytes.
+            ///
+            /// Args:
+            ///     plaintext_len: The plaintext length in bytes (UTF-8 encoded).
+            ///
+            /// Returns:
+            ///     The `out` buffer size `enc_into()` needs for such a plaintext.
+            fn max_output_len(&self, plaintext_len: usize) -> usize {
+                self.inner.format().max_obtext_len(plaintext_len)
+            }
+        }
+    };
+}
 
 /// Macro to generate Python wrapper classes for fixed-format ObtextCodec types
+///
+/// The generated classes are `frozen`: they have no mutating methods, so PyO3
+/// can hand out `&self` without the runtime borrow-flag check on every call.
 macro_rules! impl_codec_class {
     ($py_name:ident, $rust_type:ty, $doc:expr) => {
         #[doc = $doc]
-        #[pyclass]
+        #[pyclass(frozen)]
         #[allow(non_camel_case_types)]
         struct $py_name {
             inner: $rust_type,
+            names: FormatNames,
         }
 
-        #[pymethods]
-        impl $py_name {
+        codec_pymethods!($py_name {
             /// Create a new codec instance.
             ///
             /// Args:
@@ -27,7 +301,7 @@ macro_rules! impl_codec_class {
             ///     ValueError: If key is invalid or both key and keyless are provided.
             #[new]
             #[pyo3(signature = (key=None, keyless=false))]
-            fn new(key: Option<String>, keyless: bool) -> PyResult<Self> {
+            fn new(py: Python, key: Option<String>, keyless: bool) -> PyResult<Self> {
                 let inner = match (key, keyless) {
                     (Some(key), false) => <$rust_type>::new(&key).map_err(|e| {
                         PyValueError::new_err(format!("Failed to create codec: {}", e))
@@ -50,7 +324,8 @@ macro_rules! impl_codec_class {
                     }
                 };
 
-                Ok(Self { inner })
+                let names = FormatNames::new(py, inner.format());
+                Ok(Self { inner, names })
             }
 
             /// Encrypt+encode a plaintext string.
@@ -89,20 +364,20 @@ macro_rules! impl_codec_class {
             /// Returns:
             ///     Format string like "zrbcx.c32", "zrbcx.b32", "aags.b64", etc.
             #[getter]
-            fn format(&self) -> String {
-                format!("{}", self.inner.format())
+            fn format(&self, py: Python) -> Py<PyString> {
+                self.names.format.clone_ref(py)
             }
 
             /// The scheme used by this instance.
             #[getter]
-            fn scheme(&self) -> String {
-                self.inner.scheme().to_string()
+            fn scheme(&self, py: Python) -> Py<PyString> {
+                self.names.scheme.clone_ref(py)
             }
 
             /// The encoding format used by this instance.
             #[getter]
-            fn encoding(&self) -> String {
-                self.inner.encoding().to_string()
+            fn encoding(&self, py: Python) -> Py<PyString> {
+                self.names.encoding.clone_ref(py)
             }
 
             /// Get the key used by this instance (as base64 string).
@@ -126,21 +401,21 @@ macro_rules! impl_codec_class {
             fn __repr__(&self) -> String {
                 format!("{}(format='{}')", stringify!($py_name), self.inner.format())
             }
-        }
+        });
     };
 }
 
 macro_rules! impl_zcodec_class {
     ($py_name:ident, $rust_type:ty, $doc:expr) => {
         #[doc = $doc]
-        #[pyclass]
+        #[pyclass(frozen)]
         #[allow(non_camel_case_types)]
         struct $py_name {
             inner: $rust_type,
+            names: FormatNames,
         }
 
-        #[pymethods]
-        impl $py_name {
+        codec_pymethods!($py_name {
             /// Create a new codec instance.
             ///
             /// Args:
@@ -154,7 +429,7 @@ macro_rules! impl_zcodec_class {
             ///     ValueError: If secret is invalid or both secret and keyless are provided.
             #[new]
             #[pyo3(signature = (secret=None, keyless=false))]
-            fn new(secret: Option<String>, keyless: bool) -> PyResult<Self> {
+            fn new(py: Python, secret: Option<String>, keyless: bool) -> PyResult<Self> {
                 let inner = match (secret, keyless) {
                     (Some(secret), false) => <$rust_type>::new(&secret).map_err(|e| {
                         PyValueError::new_err(format!("Failed to create codec: {}", e))
@@ -177,7 +452,8 @@ macro_rules! impl_zcodec_class {
                     }
                 };
 
-                Ok(Self { inner })
+                let names = FormatNames::new(py, inner.format());
+                Ok(Self { inner, names })
             }
 
             /// Encrypt+encode a plaintext string.
@@ -216,20 +492,20 @@ macro_rules! impl_zcodec_class {
             /// Returns:
             ///     Format string like "zrbcx.c32", "zrbcx.b32", etc.
             #[getter]
-            fn format(&self) -> String {
-                format!("{}", self.inner.format())
+            fn format(&self, py: Python) -> Py<PyString> {
+                self.names.format.clone_ref(py)
             }
 
             /// The scheme used by this instance.
             #[getter]
-            fn scheme(&self) -> String {
-                self.inner.scheme().to_string()
+            fn scheme(&self, py: Python) -> Py<PyString> {
+                self.names.scheme.clone_ref(py)
             }
 
             /// The encoding format used by this instance.
             #[getter]
-            fn encoding(&self) -> String {
-                self.inner.encoding().to_string()
+            fn encoding(&self, py: Python) -> Py<PyString> {
+                self.names.encoding.clone_ref(py)
             }
 
             /// Get the secret used by this instance (as base64 string).
@@ -253,7 +529,7 @@ macro_rules! impl_zcodec_class {
             fn __repr__(&self) -> String {
                 format!("{}(format='{}')", stringify!($py_name), self.inner.format())
             }
-        }
+        });
     };
 }
 
@@ -392,6 +668,33 @@ impl_codec_class!(
     "Upbc codec (probabilistic AES-CBC) with Hex encoding"
 );
 
+// Apae variants (experimental)
+// ------------
+#[cfg(feature = "apae")]
+impl_codec_class!(
+    ApaeB32,
+    ::oboron::ApaeB32,
+    "Apae codec (probabilistic AEGIS-128L, experimental) with B32 encoding"
+);
+#[cfg(feature = "apae")]
+impl_codec_class!(
+    ApaeB64,
+    ::oboron::ApaeB64,
+    "Apae codec (probabilistic AEGIS-128L, experimental) with B64 encoding"
+);
+#[cfg(feature = "apae")]
+impl_codec_class!(
+    ApaeC32,
+    ::oboron::ApaeC32,
+    "Apae codec (probabilistic AEGIS-128L, experimental) with C32 encoding"
+);
+#[cfg(feature = "apae")]
+impl_codec_class!(
+    ApaeHex,
+    ::oboron::ApaeHex,
+    "Apae codec (probabilistic AEGIS-128L, experimental) with Hex encoding"
+);
+
 // Zrbcx variants
 // -------------
 #[cfg(feature = "zrbcx")]
@@ -510,12 +813,12 @@ struct Ob {
     inner: ::oboron::Ob,
 }
 
-#[pymethods]
-impl Ob {
+codec_pymethods!(Ob {
     /// Create a new Ob instance.
     ///
     /// Args:
-    ///     format: Format string like "aags.b64", "apsv.hex", "zrbcx.c32", "zrbcx.b32", etc.
+    ///     format: Format string like "aags.b64", "apsv.hex", "zrbcx.c32", "zrbcx.b32", etc.,
+    ///         or an `oboron.formats.Format` member.
     ///     key:     86-character base64 string key (512 bits). Required if keyless=False.
     ///     keyless: If True, uses the hardcoded key (testing only, NOT SECURE).
     ///
@@ -526,13 +829,17 @@ impl Ob {
     ///     ValueError: If key or format is invalid.
     #[new]
     #[pyo3(signature = (format, key=None, keyless=false))]
-    fn new(format: &str, key: Option<String>, keyless: bool) -> PyResult<Self> {
+    fn new(format: &Bound<'_, PyAny>, key: Option<String>, keyless: bool) -> PyResult<Self> {
+        let format = format_arg(format)?;
         let inner = match (key, keyless) {
-            (Some(key), false) => ::oboron::Ob::new(format, &key)
+            (Some(key), false) => format
+                .and_then(|format| ::oboron::Ob::new(format, &key))
                 .map_err(|e| PyValueError::new_err(format!("Failed to create Ob: {}", e)))?,
-            (None, true) => ::oboron::Ob::new_keyless(format).map_err(|e| {
-                PyValueError::new_err(format!("Failed to create Ob with hardcoded key: {}", e))
-            })?,
+            (None, true) => format
+                .and_then(|format| ::oboron::Ob::new_keyless(format))
+                .map_err(|e| {
+                    PyValueError::new_err(format!("Failed to create Ob with hardcoded key: {}", e))
+                })?,
             (Some(_), true) => {
                 return Err(PyValueError::new_err(
                     "Cannot specify both key and keyless=True",
@@ -550,28 +857,28 @@ impl Ob {
 
     /// Encrypt+encode a plaintext string.
     ///
-    /// Args:  
+    /// Args:
     ///     plaintext: The plaintext string to encrypt+encode.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The obtext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If encoding fails.
     fn enc(&self, plaintext: &str) -> PyResult<String> {
         let result = self.inner.enc(plaintext);
         result.map_err(|e| PyValueError::new_err(format!("Enc operation failed: {}", e)))
     }
 
-    /// Decode+decrypt an obtext string back to plaintext.  
+    /// Decode+decrypt an obtext string back to plaintext.
     ///
-    /// Args:  
-    ///     obtext: The encrypted+encoded string to decode.  
+    /// Args:
+    ///     obtext: The encrypted+encoded string to decode.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The decoded plaintext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If the dec operation fails
     #[pyo3(signature = (obtext))]
     fn dec(&self, obtext: &str) -> PyResult<String> {
@@ -584,13 +891,13 @@ impl Ob {
     /// This method tries to decode with the instance's encoding, and if that fails
     /// it does full format autodetection (`Omnib.autodec()` functionality as failover)
     ///
-    /// Args:  
+    /// Args:
     ///     obtext: The encrypted+encoded string to decode+decrypt.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The decoded+decrypted plaintext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If the dec operation fails or format cannot be detected.
     fn autodec(&self, obtext: &str) -> PyResult<String> {
         let result = self.inner.autodec(obtext);
@@ -636,25 +943,26 @@ impl Ob {
         Ok(PyBytes::new_bound(py, self.inner.key_bytes()).into())
     }
 
-    /// Change the format (scheme + encoding).  
+    /// Change the format (scheme + encoding).
     ///
-    /// Args:  
-    ///     format: Format string like "aags.b64", "apsv.hex", "apgs.c32", "aasv.b32", etc.
+    /// Args:
+    ///     format: Format string like "aags.b64", "apsv.hex", "apgs.c32", "aasv.b32", etc.,
+    ///         or an `oboron.formats.Format` member.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If format is invalid.
-    fn set_format(&mut self, format: &str) -> PyResult<()> {
-        self.inner
-            .set_format(format)
+    fn set_format(&mut self, format: &Bound<'_, PyAny>) -> PyResult<()> {
+        format_arg(format)?
+            .and_then(|format| self.inner.set_format(format))
             .map_err(|e| PyValueError::new_err(format!("Failed to set format: {}", e)))
     }
 
     /// Change the scheme while keeping the current encoding.
     ///
-    /// Args:  
-    ///     scheme: Scheme name like "aags", "apsv", "apgs", etc.  
+    /// Args:
+    ///     scheme: Scheme name like "aags", "apsv", "apgs", etc.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If scheme is invalid.
     fn set_scheme(&mut self, scheme: &str) -> PyResult<()> {
         let scheme_enum = ::oboron::Scheme::from_str(scheme)
@@ -666,11 +974,11 @@ impl Ob {
 
     /// Change the encoding while keeping the current scheme.
     ///
-    /// Args:  
+    /// Args:
     ///     encoding: Encoding name: "b32", "b64", "c32", "hex".
     ///               Also accepts long forms: "base32rfc", "base64", "base32crockford", or "hex".
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If encoding is invalid.
     fn set_encoding(&mut self, encoding: &str) -> PyResult<()> {
         let encoding_enum = ::oboron::Encoding::from_str(encoding)
@@ -683,14 +991,14 @@ impl Ob {
     fn __repr__(&self) -> String {
         format!("Ob(format='{}')", self.inner.format())
     }
-}
+});
 
 /// Omnib - Multi-format codec with full autodetection.
 ///
 /// Unlike other codecs, Omnib doesn't store a format internally.
 /// The format must be specified for each enc operation, and it can
 /// automatically detect both scheme and encoding on dec operations.
-#[pyclass]
+#[pyclass(frozen)]
 struct Omnib {
     inner: ::oboron::Omnib,
 }
@@ -811,12 +1119,12 @@ struct Obz {
     inner: ::oboron::ztier::Obz,
 }
 
-#[pymethods]
-impl Obz {
+codec_pymethods!(Obz {
     /// Create a new Obz instance.
     ///
     /// Args:
-    ///     format: Format string like "aags.b64", "apsv.hex", "zrbcx.c32", "zrbcx.b32", etc.
+    ///     format: Format string like "aags.b64", "apsv.hex", "zrbcx.c32", "zrbcx.b32", etc.,
+    ///         or an `oboron.formats.Format` member.
     ///     key:     86-character base64 string key (512 bits). Required if keyless=False.
     ///     keyless: If True, uses the hardcoded key (testing only, NOT SECURE).
     ///
@@ -827,13 +1135,17 @@ impl Obz {
     ///     ValueError: If key or format is invalid.
     #[new]
     #[pyo3(signature = (format, key=None, keyless=false))]
-    fn new(format: &str, key: Option<String>, keyless: bool) -> PyResult<Self> {
+    fn new(format: &Bound<'_, PyAny>, key: Option<String>, keyless: bool) -> PyResult<Self> {
+        let format = format_arg(format)?;
         let inner = match (key, keyless) {
-            (Some(key), false) => ::oboron::ztier::Obz::new(format, &key)
+            (Some(key), false) => format
+                .and_then(|format| ::oboron::ztier::Obz::new(format, &key))
                 .map_err(|e| PyValueError::new_err(format!("Failed to create Obz: {}", e)))?,
-            (None, true) => ::oboron::ztier::Obz::new_keyless(format).map_err(|e| {
-                PyValueError::new_err(format!("Failed to create Obz with hardcoded key: {}", e))
-            })?,
+            (None, true) => format
+                .and_then(|format| ::oboron::ztier::Obz::new_keyless(format))
+                .map_err(|e| {
+                    PyValueError::new_err(format!("Failed to create Obz with hardcoded key: {}", e))
+                })?,
             (Some(_), true) => {
                 return Err(PyValueError::new_err(
                     "Cannot specify both key and keyless=True",
@@ -851,28 +1163,28 @@ impl Obz {
 
     /// Encrypt+encode a plaintext string.
     ///
-    /// Args:  
+    /// Args:
     ///     plaintext: The plaintext string to encrypt+encode.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The obtext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If encoding fails.
     fn enc(&self, plaintext: &str) -> PyResult<String> {
         let result = self.inner.enc(plaintext);
         result.map_err(|e| PyValueError::new_err(format!("Enc operation failed: {}", e)))
     }
 
-    /// Decode+decrypt an obtext string back to plaintext.  
+    /// Decode+decrypt an obtext string back to plaintext.
     ///
-    /// Args:  
-    ///     obtext: The encrypted+encoded string to decode.  
+    /// Args:
+    ///     obtext: The encrypted+encoded string to decode.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The decoded plaintext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If the dec operation fails
     #[pyo3(signature = (obtext))]
     fn dec(&self, obtext: &str) -> PyResult<String> {
@@ -885,13 +1197,13 @@ impl Obz {
     /// This method tries to decode with the instance's encoding, and if that fails
     /// it does full format autodetection (`Omnib.autodec()` functionality as failover)
     ///
-    /// Args:  
+    /// Args:
     ///     obtext: The encrypted+encoded string to decode+decrypt.
     ///
-    /// Returns:  
+    /// Returns:
     ///     The decoded+decrypted plaintext string.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If the dec operation fails or format cannot be detected.
     fn autodec(&self, obtext: &str) -> PyResult<String> {
         let result = self.inner.autodec(obtext);
@@ -937,25 +1249,26 @@ impl Obz {
         Ok(PyBytes::new_bound(py, self.inner.secret_bytes()).into())
     }
 
-    /// Change the format (scheme + encoding).  
+    /// Change the format (scheme + encoding).
     ///
-    /// Args:  
-    ///     format: Format string like "zrbcx.b64", "zrbcx.hex", "zrbcx.c32", "zrbcx.b32", etc.
+    /// Args:
+    ///     format: Format string like "zrbcx.b64", "zrbcx.hex", "zrbcx.c32", "zrbcx.b32", etc.,
+    ///         or an `oboron.formats.Format` member.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If format is invalid.
-    fn set_format(&mut self, format: &str) -> PyResult<()> {
-        self.inner
-            .set_format(format)
+    fn set_format(&mut self, format: &Bound<'_, PyAny>) -> PyResult<()> {
+        format_arg(format)?
+            .and_then(|format| self.inner.set_format(format))
             .map_err(|e| PyValueError::new_err(format!("Failed to set format: {}", e)))
     }
 
     /// Change the scheme while keeping the current encoding.
     ///
-    /// Args:  
-    ///     scheme: Scheme name like "zrbcx", "zmock1", etc.  
+    /// Args:
+    ///     scheme: Scheme name like "zrbcx", "zmock1", etc.
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If scheme is invalid.
     fn set_scheme(&mut self, scheme: &str) -> PyResult<()> {
         let scheme_enum = ::oboron::Scheme::from_str(scheme)
@@ -967,11 +1280,11 @@ impl Obz {
 
     /// Change the encoding while keeping the current scheme.
     ///
-    /// Args:  
+    /// Args:
     ///     encoding: Encoding name: "b32", "b64", "c32", "hex".
     ///               Also accepts long forms: "base32rfc", "base64", "base32crockford", or "hex".
     ///
-    /// Raises:  
+    /// Raises:
     ///     ValueError: If encoding is invalid.
     fn set_encoding(&mut self, encoding: &str) -> PyResult<()> {
         let encoding_enum = ::oboron::Encoding::from_str(encoding)
@@ -984,10 +1297,10 @@ impl Obz {
     fn __repr__(&self) -> String {
         format!("Obz(format='{}')", self.inner.format())
     }
-}
+});
 
 // Z-tier schemes - Omnibz
-#[pyclass]
+#[pyclass(frozen)]
 struct Omnibz {
     inner: ::oboron::ztier::Omnibz,
 }
@@ -1130,6 +1443,30 @@ fn generate_key_bytes(py: Python) -> PyResult<Py<PyBytes>> {
     Ok(PyBytes::new_bound(py, &key).into())
 }
 
+/// Generate `n` random 64-byte keys as bytes.
+///
+/// All keys are generated in one pass with the GIL released, which is much
+/// cheaper than calling `generate_key_bytes()` `n` times.
+///
+/// Args:
+///     n: Number of keys to generate.
+///
+/// Returns:
+///     A list of `n` random 64-byte keys as bytes.
+///
+/// Raises:
+///     ValueError: If `n` keys cannot be allocated.
+#[pyfunction]
+fn generate_keys(py: Python, n: usize) -> PyResult<Vec<Py<PyBytes>>> {
+    let keys = py
+        .allow_threads(|| ::oboron::generate_keys_bytes(n))
+        .ok_or_else(|| PyValueError::new_err(format!("Cannot generate {} keys", n)))?;
+    Ok(keys
+        .iter()
+        .map(|key| PyBytes::new_bound(py, key).unbind())
+        .collect())
+}
+
 /// Generate a random 32-byte secret as a base64 string.
 ///
 /// Returns:
@@ -1325,6 +1662,15 @@ fn _oboron(m: &Bound<'_, PyModule>) -> PyResult<()> {
         m.add_class::<UpbcHex>()?;
     }
 
+    // Apae variants (experimental)
+    #[cfg(feature = "apae")]
+    {
+        m.add_class::<ApaeC32>()?;
+        m.add_class::<ApaeB32>()?;
+        m.add_class::<ApaeB64>()?;
+        m.add_class::<ApaeHex>()?;
+    }
+
     // TESTING =======================
 
     // Mock variants
@@ -1381,6 +1727,7 @@ fn _oboron(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(generate_key, m)?)?;
     m.add_function(wrap_pyfunction!(generate_key_hex, m)?)?;
     m.add_function(wrap_pyfunction!(generate_key_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(generate_keys, m)?)?;
     m.add_function(wrap_pyfunction!(generate_secret, m)?)?;
     m.add_function(wrap_pyfunction!(generate_secret_hex, m)?)?;
     m.add_function(wrap_pyfunction!(generate_secret_bytes, m)?)?;
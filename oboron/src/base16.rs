@@ -0,0 +1,140 @@
+//! Lowercase hex (base16) for obtext.
+//!
+//! Encoding and decoding use a SWAR (SIMD-within-a-register) kernel: four
+//! bytes are spread into eight nibble lanes of a `u64` and mapped to ASCII
+//! with a branchless `0-9`/`a-f` correction, and decoding validates and
+//! converts eight symbols at a time with per-lane range masks.
+//!
+//! Decoding is strict, matching the `data-encoding` `HEXLOWER` behaviour it
+//! replaces: only `0-9a-f` are accepted (no uppercase) and the length must
+//! be even.
+use crate::error::Error;
+
+/// `n` in every byte lane.
+const fn splat(n: u8) -> u64 {
+    0x0101_0101_0101_0101 * n as u64
+}
+
+const HIGH_BITS: u64 = splat(0x80);
+
+/// Spread four bytes into eight nibble lanes, high nibble first.
+#[inline(always)]
+fn spread(x: u32) -> u64 {
+    let x = x as u64;
+    let x = ((x << 16) | x) & 0x0000_ffff_0000_ffff;
+    let x = ((x << 8) | x) & 0x00ff_00ff_00ff_00ff;
+    ((x << 4) | x) & splat(0x0f)
+}
+
+/// Inverse of [`spread`]: pack eight nibble lanes into four bytes.
+#[inline(always)]
+fn pack(x: u64) -> u32 {
+    let x = ((x >> 4) | x) & 0x00ff_00ff_00ff_00ff;
+    let x = ((x >> 8) | x) & 0x0000_ffff_0000_ffff;
+    (((x >> 16) | x) & 0xffff_ffff) as u32
+}
+
+/// Eight ASCII hex symbols for four bytes.
+#[inline(always)]
+fn encode_word(x: u32) -> [u8; 8] {
+    let n = spread(x);
+    // '0' + n, plus 'a' - '9' - 1 for the lanes where n >= 10
+    let letters = ((n + splat(0x06)) >> 4) & splat(0x01);
+    (n + splat(b'0') + letters * (b'a' - b'9' - 1) as u64).to_be_bytes()
+}
+
+/// Per-lane `0x80` mask of the 7-bit lanes holding a value `>= t`.
+#[inline(always)]
+fn ge(lanes: u64, t: u8) -> u64 {
+    (lanes + splat(0x80 - t)) & HIGH_BITS
+}
+
+/// Four bytes from eight ASCII hex symbols.
+#[inline(always)]
+fn decode_word(symbols: &[u8; 8]) -> Result<u32, Error> {
+    let c = u64::from_be_bytes(*symbols);
+    if c & HIGH_BITS != 0 {
+        return Err(Error::InvalidHex);
+    }
+    let digit = ge(c, b'0') & !ge(c, b'9' + 1);
+    let letter = ge(c, b'a') & !ge(c, b'f' + 1);
+    if digit | letter != HIGH_BITS {
+        return Err(Error::InvalidHex);
+    }
+    // Low nibble of '0'..'9' is the value; 'a'..'f' need 9 added
+    let n = (c & splat(0x0f)) + (letter >> 7) * 9;
+    Ok(pack(n))
+}
+
+#[inline]
+pub(crate) fn encode(bytes: &[u8]) -> String {
+    let mut out = Vec::with_capacity(bytes.len() * 2);
+    let mut words = bytes.chunks_exact(4);
+    for word in &mut words {
+        out.extend_from_slice(&encode_word(u32::from_be_bytes(word.try_into().unwrap())));
+    }
+    let rest = words.remainder();
+    if !rest.is_empty() {
+        let mut word = [0u8; 4];
+        word[..rest.len()].copy_from_slice(rest);
+        out.extend_from_slice(&encode_word(u32::from_be_bytes(word))[..rest.len() * 2]);
+    }
+    // SAFETY: every output byte is an ASCII hex digit.
+    unsafe { String::from_utf8_unchecked(out) }
+}
+
+#[inline]
+pub(crate) fn decode(text: &str) -> Result<Vec<u8>, Error> {
+    let text = text.as_bytes();
+    if text.len() % 2 != 0 {
+        return Err(Error::InvalidHex);
+    }
+    let mut out = Vec::with_capacity(text.len() / 2);
+    let mut words = text.chunks_exact(8);
+    for word in &mut words {
+        out.extend_from_slice(&decode_word(word.try_into().unwrap())?.to_be_bytes());
+    }
+    let rest = words.remainder();
+    if !rest.is_empty() {
+        let mut word = [b'0'; 8];
+        word[..rest.len()].copy_from_slice(rest);
+        out.extend_from_slice(&decode_word(&word)?.to_be_bytes()[..rest.len() / 2]);
+    }
+    Ok(out)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_matches_data_encoding() {
+        let data: Vec<u8> = (0..=255u8).chain(0..=255u8).rev().collect();
+        for len in 0..=data.len() {
+            let expected = data_encoding::HEXLOWER.encode(&data[..len]);
+            assert_eq!(encode(&data[..len]), expected);
+            assert_eq!(decode(&expected).unwrap(), &data[..len]);
+        }
+    }
+
+    #[test]
+    fn test_decode_is_strict() {
+        for text in [
+            "0", "abc", "0A", "AB", "0g", "g0", "/0", ":0", "`0", "\u{e9}",
+        ] {
+            assert_eq!(decode(text), Err(Error::InvalidHex), "{:?}", text);
+        }
+        assert_eq!(decode("00ff10af").unwrap(), vec![0x00, 0xff, 0x10, 0xaf]);
+        assert_eq!(decode("0123456789abcdef0F"), Err(Error::InvalidHex));
+    }
+
+    #[test]
+    fn test_decode_rejects_each_lane() {
+        // A single bad symbol in any lane of a full word is caught
+        for i in 0..8 {
+            let mut word = *b"01234567";
+            word[i] = b'G';
+            assert!(decode_word(&word).is_err());
+        }
+    }
+}
@@ -1,21 +1,244 @@
-//! Custom BASE32 encoding, using lowercased Douglas Crockford's alphabet
+//! Base32 encodings for obtext: RFC 4648 (uppercase, no padding) and a
+//! lowercased Douglas Crockford alphabet.
 //!
-pub(crate) use data_encoding::BASE32_NOPAD as BASE32_RFC;
-use data_encoding::{Encoding, Specification};
-use once_cell::sync::Lazy;
-
-pub(crate) static BASE32_CROCKFORD: Lazy<Encoding> = Lazy::new(|| {
-    let mut spec = Specification::new();
-    // spec.symbols.push_str("abcdefghijklmnopqrstuvwxyz234567");
-    spec.symbols.push_str("0123456789abcdefghjkmnpqrstvwxyz"); // <- Crockford's base32!
-    spec.padding = None;
-    spec.encoding().unwrap()
-});
+//! Both alphabets are handled by a SWAR (SIMD-within-a-register) kernel:
+//! each 5-byte group is loaded into a `u64`, its eight 5-bit indices are
+//! spread into eight byte lanes with three shift/mask steps, and the lanes are
+//! mapped to ASCII branchlessly with per-lane threshold masks.  Decoding runs
+//! the same steps in reverse after a table lookup.
+//!
+//! Decoding is strict, matching the `data-encoding` behaviour it replaces:
+//! symbols are case-sensitive, lengths that no byte string encodes to are
+//! rejected, and the unused trailing bits of the last symbol must be zero.
+//! Every byte string therefore has exactly one accepted encoding.
+
+/// Error returned by [`Base32::decode`] for non-canonical or invalid input.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) struct DecodeError;
+
+#[derive(Clone, Copy)]
+enum Alphabet {
+    /// `A-Z2-7` (or `a-z2-7` when `lower`): two linear runs.
+    Rfc { lower: bool },
+    /// `0-9a-hjkmnp-tv-z`: digits, then letters skipping i, l, o and u.
+    Crockford,
+}
+
+/// A no-padding base32 encoding with a SWAR encode/decode kernel.
+pub(crate) struct Base32 {
+    alphabet: Alphabet,
+    /// Symbol value by ASCII byte, `INVALID` for bytes outside the alphabet.
+    decode_table: [u8; 256],
+}
+
+const INVALID: u8 = 0xff;
+
+/// One in every byte lane.
+const ONES: u64 = 0x0101_0101_0101_0101;
+
+pub(crate) static BASE32_RFC: Base32 =
+    Base32::new(Alphabet::Rfc { lower: false }, b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567");
+
+pub(crate) static BASE32_CROCKFORD: Base32 =
+    Base32::new(Alphabet::Crockford, b"0123456789abcdefghjkmnpqrstvwxyz"); // <- Crockford's base32!
 
 #[cfg(feature = "legacy")]
-pub(crate) static BASE32_RFC_LOWER: Lazy<Encoding> = Lazy::new(|| {
-    let mut spec = Specification::new();
-    spec.symbols.push_str("abcdefghijklmnopqrstuvwxyz234567"); // RFC 4648 lowercase
-    spec.padding = None;
-    spec.encoding().unwrap()
-});
+pub(crate) static BASE32_RFC_LOWER: Base32 =
+    Base32::new(Alphabet::Rfc { lower: true }, b"abcdefghijklmnopqrstuvwxyz234567"); // RFC 4648 lowercase
+
+/// Spread the low 40 bits of `x` into eight 5-bit values, one per byte lane,
+/// first symbol in the most significant lane.
+#[inline(always)]
+fn spread(x: u64) -> u64 {
+    let x = ((x & 0x00ff_fff0_0000) << 12) | (x & 0x000f_ffff);
+    let x = ((x & 0x000f_fc00_000f_fc00) << 6) | (x & 0x0000_03ff_0000_03ff);
+    ((x & 0x03e0_03e0_03e0_03e0) << 3) | (x & 0x001f_001f_001f_001f)
+}
+
+/// Inverse of [`spread`]: pack eight 5-bit byte lanes into 40 bits.
+#[inline(always)]
+fn pack(x: u64) -> u64 {
+    let x = ((x >> 3) & 0x03e0_03e0_03e0_03e0) | (x & 0x001f_001f_001f_001f);
+    let x = ((x >> 6) & 0x000f_fc00_000f_fc00) | (x & 0x0000_03ff_0000_03ff);
+    ((x >> 12) & 0x00ff_fff0_0000) | (x & 0x000f_ffff)
+}
+
+/// Per-lane 0/1 mask of the 5-bit lanes holding a value `>= t`.
+#[inline(always)]
+fn ge(lanes: u64, t: u8) -> u64 {
+    ((lanes + ONES * (0x80 - t as u64)) >> 7) & ONES
+}
+
+impl Base32 {
+    const fn new(alphabet: Alphabet, symbols: &[u8; 32]) -> Self {
+        let mut decode_table = [INVALID; 256];
+        let mut i = 0;
+        while i < 32 {
+            decode_table[symbols[i] as usize] = i as u8;
+            i += 1;
+        }
+        Base32 {
+            alphabet,
+            decode_table,
+        }
+    }
+
+    /// Map eight 5-bit lanes to their ASCII symbols.
+    #[inline(always)]
+    fn to_ascii(&self, lanes: u64) -> u64 {
+        match self.alphabet {
+            Alphabet::Rfc { lower } => {
+                let base = u64::from(if lower { b'a' } else { b'A' });
+                // Values 26..=31 map to '2'..='7', i.e. value + 24.
+                lanes + ONES * base - ge(lanes, 26) * (base - 24)
+            }
+            Alphabet::Crockford => {
+                // '0' + value, then close the gaps: digits->letters, and the
+                // skipped i, l, o, u.
+                lanes
+                    + ONES * b'0' as u64
+                    + ge(lanes, 10) * (b'a' - b'9' - 1) as u64
+                    + ge(lanes, 18)
+                    + ge(lanes, 20)
+                    + ge(lanes, 22)
+                    + ge(lanes, 27)
+            }
+        }
+    }
+
+    #[inline(always)]
+    fn encode_group(&self, group: &[u8; 5]) -> [u8; 8] {
+        let x = (group[0] as u64) << 32
+            | (group[1] as u64) << 24
+            | (group[2] as u64) << 16
+            | (group[3] as u64) << 8
+            | group[4] as u64;
+        self.to_ascii(spread(x)).to_be_bytes()
+    }
+
+    /// Decode up to eight symbols into 40 bits; missing symbols count as zero.
+    #[inline(always)]
+    fn decode_group(&self, symbols: &[u8]) -> Result<u64, DecodeError> {
+        let mut lanes = 0u64;
+        let mut invalid = 0u8;
+        for i in 0..8 {
+            let v = match symbols.get(i) {
+                Some(&c) => self.decode_table[c as usize],
+                None => 0,
+            };
+            invalid |= v;
+            lanes = (lanes << 8) | v as u64;
+        }
+        if invalid & 0xe0 != 0 {
+            return Err(DecodeError);
+        }
+        Ok(pack(lanes))
+    }
+
+    pub(crate) fn encode(&self, bytes: &[u8]) -> String {
+        let mut out = Vec::with_capacity((bytes.len() * 8 + 4) / 5);
+        let mut groups = bytes.chunks_exact(5);
+        for group in &mut groups {
+            out.extend_from_slice(&self.encode_group(group.try_into().unwrap()));
+        }
+        let rest = groups.remainder();
+        if !rest.is_empty() {
+            let mut group = [0u8; 5];
+            group[..rest.len()].copy_from_slice(rest);
+            let symbols = self.encode_group(&group);
+            out.extend_from_slice(&symbols[..(rest.len() * 8 + 4) / 5]);
+        }
+        // SAFETY: every alphabet symbol is ASCII.
+        unsafe { String::from_utf8_unchecked(out) }
+    }
+
+    pub(crate) fn decode(&self, text: &[u8]) -> Result<Vec<u8>, DecodeError> {
+        // A trailing partial group of 1, 3 or 6 symbols is not produced by any
+        // byte string.
+        let tail = text.len() % 8;
+        if matches!(tail, 1 | 3 | 6) {
+            return Err(DecodeError);
+        }
+        let mut out = Vec::with_capacity(text.len() * 5 / 8);
+        let mut groups = text.chunks_exact(8);
+        for group in &mut groups {
+            let x = self.decode_group(group)?;
+            out.extend_from_slice(&x.to_be_bytes()[3..]);
+        }
+        let rest = groups.remainder();
+        if !rest.is_empty() {
+            let x = self.decode_group(rest)?;
+            let len = rest.len() * 5 / 8;
+            // The bits past the last whole byte must be zero.
+            if x & ((1u64 << (40 - len * 8)) - 1) != 0 {
+                return Err(DecodeError);
+            }
+            out.extend_from_slice(&x.to_be_bytes()[3..3 + len]);
+        }
+        Ok(out)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Bit-at-a-time reference encoder.
+    fn reference_encode(symbols: &[u8; 32], bytes: &[u8]) -> String {
+        let mut out = String::new();
+        let (mut acc, mut bits) = (0u32, 0);
+        for &b in bytes {
+            acc = ((acc << 8) | b as u32) & 0xffff;
+            bits += 8;
+            while bits >= 5 {
+                bits -= 5;
+                out.push(symbols[((acc >> bits) & 31) as usize] as char);
+            }
+        }
+        if bits > 0 {
+            out.push(symbols[((acc << (5 - bits)) & 31) as usize] as char);
+        }
+        out
+    }
+
+    fn check_roundtrip(codec: &Base32, symbols: &[u8; 32]) {
+        let data: Vec<u8> = (0..300u32).map(|i| (i * 167 + 13) as u8).collect();
+        for len in 0..data.len() {
+            let encoded = codec.encode(&data[..len]);
+            assert_eq!(encoded, reference_encode(symbols, &data[..len]));
+            assert_eq!(codec.decode(encoded.as_bytes()).unwrap(), &data[..len]);
+        }
+        for b in 0..=255u8 {
+            let encoded = codec.encode(&[b; 5]);
+            assert_eq!(encoded, reference_encode(symbols, &[b; 5]));
+        }
+    }
+
+    #[test]
+    fn test_rfc_matches_reference() {
+        check_roundtrip(&BASE32_RFC, b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567");
+        assert_eq!(BASE32_RFC.encode(b"foobar"), "MZXW6YTBOI");
+    }
+
+    #[test]
+    fn test_crockford_matches_reference() {
+        check_roundtrip(&BASE32_CROCKFORD, b"0123456789abcdefghjkmnpqrstvwxyz");
+    }
+
+    #[test]
+    fn test_decode_is_strict() {
+        // Invalid lengths
+        for text in ["a", "abc", "abcdefghj"] {
+            assert_eq!(BASE32_CROCKFORD.decode(text.as_bytes()), Err(DecodeError));
+        }
+        // Non-zero trailing bits ("01" would be canonical for [0x00])
+        assert_eq!(BASE32_CROCKFORD.decode(b"01"), Err(DecodeError));
+        assert_eq!(BASE32_CROCKFORD.decode(b"00").unwrap(), vec![0u8]);
+        // Symbols outside the alphabet, including the wrong case
+        for text in ["0i", "0l", "0o", "0u", "0A", "0="] {
+            assert_eq!(BASE32_CROCKFORD.decode(text.as_bytes()), Err(DecodeError));
+        }
+        assert_eq!(BASE32_RFC.decode(b"mzxw6ytboi"), Err(DecodeError));
+        assert_eq!(BASE32_RFC.decode(b"MZXW6YTBOI").unwrap(), b"foobar");
+    }
+}
@@ -0,0 +1,41 @@
+//! URL-safe base64 (RFC 4648 base64url, no padding) for obtext.
+//!
+//! With the `simd` feature, encoding uses the `base64-simd` crate, which picks
+//! an AVX2/SSSE3/NEON/simd128 kernel by runtime CPU detection and falls back
+//! to scalar code otherwise.  Decoding always goes through `data-encoding`,
+//! whose strict canonical-form checks keep obtext decoding injective.
+use crate::error::Error;
+
+#[inline(always)]
+pub(crate) fn encode(bytes: &[u8]) -> String {
+    #[cfg(feature = "simd")]
+    {
+        base64_simd::URL_SAFE_NO_PAD.encode_to_string(bytes)
+    }
+    #[cfg(not(feature = "simd"))]
+    {
+        data_encoding::BASE64URL_NOPAD.encode(bytes)
+    }
+}
+
+#[inline(always)]
+pub(crate) fn decode(text: &str) -> Result<Vec<u8>, Error> {
+    data_encoding::BASE64URL_NOPAD
+        .decode(text.as_bytes())
+        .map_err(|_| Error::InvalidB64)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_encode_matches_data_encoding() {
+        let bytes: Vec<u8> = (0..=255u8).cycle().take(300).collect();
+        for len in 0..bytes.len() {
+            let expected = data_encoding::BASE64URL_NOPAD.encode(&bytes[..len]);
+            assert_eq!(encode(&bytes[..len]), expected, "length {}", len);
+            assert_eq!(decode(&expected).unwrap(), &bytes[..len]);
+        }
+    }
+}
@@ -417,8 +417,8 @@ fn encode_bytes(bytes: &[u8], encoding: Encoding) -> String {
     match encoding {
         Encoding::C32 => crate::base32::BASE32_CROCKFORD.encode(bytes),
         Encoding::B32 => crate::base32::BASE32_RFC.encode(bytes),
-        Encoding::B64 => data_encoding::BASE64URL_NOPAD.encode(bytes),
-        Encoding::Hex => data_encoding::HEXLOWER.encode(bytes),
+        Encoding::B64 => crate::base64::encode(bytes),
+        Encoding::Hex => crate::base16::encode(bytes),
     }
 }
 
@@ -431,12 +431,8 @@ fn decode_bytes(text: &str, encoding: Encoding) -> Result<Vec<u8>, Error> {
         Encoding::B32 => crate::base32::BASE32_RFC
             .decode(text.as_bytes())
             .map_err(|_| Error::InvalidB32),
-        Encoding::B64 => data_encoding::BASE64URL_NOPAD
-            .decode(text.as_bytes())
-            .map_err(|_| Error::InvalidB64),
-        Encoding::Hex => data_encoding::HEXLOWER
-            .decode(text.as_bytes())
-            .map_err(|_| Error::InvalidHex),
+        Encoding::B64 => crate::base64::decode(text),
+        Encoding::Hex => crate::base16::decode(text),
     }
 }
 
@@ -610,6 +606,48 @@ impl_codec_64!(
     apsv
 );
 
+// apae variants (16-byte key slice; experimental)
+#[cfg(feature = "apae")]
+impl_codec_32!(
+    ApaeC32,
+    Scheme::Apae,
+    Encoding::C32,
+    "apae.c32",
+    crate::encrypt_apae,
+    crate::decrypt_apae,
+    apae
+);
+#[cfg(feature = "apae")]
+impl_codec_32!(
+    ApaeB32,
+    Scheme::Apae,
+    Encoding::B32,
+    "apae.b32",
+    crate::encrypt_apae,
+    crate::decrypt_apae,
+    apae
+);
+#[cfg(feature = "apae")]
+impl_codec_32!(
+    ApaeB64,
+    Scheme::Apae,
+    Encoding::B64,
+    "apae.b64",
+    crate::encrypt_apae,
+    crate::decrypt_apae,
+    apae
+);
+#[cfg(feature = "apae")]
+impl_codec_32!(
+    ApaeHex,
+    Scheme::Apae,
+    Encoding::Hex,
+    "apae.hex",
+    crate::encrypt_apae,
+    crate::decrypt_apae,
+    apae
+);
+
 // upbc variants (32-byte key)
 #[cfg(feature = "upbc")]
 impl_codec_32!(
@@ -774,6 +812,14 @@ pub enum ObAny {
     ApsvB64(ApsvB64),
     #[cfg(feature = "apsv")]
     ApsvHex(ApsvHex),
+    #[cfg(feature = "apae")]
+    ApaeC32(ApaeC32),
+    #[cfg(feature = "apae")]
+    ApaeB32(ApaeB32),
+    #[cfg(feature = "apae")]
+    ApaeB64(ApaeB64),
+    #[cfg(feature = "apae")]
+    ApaeHex(ApaeHex),
     #[cfg(feature = "upbc")]
     UpbcC32(UpbcC32),
     #[cfg(feature = "upbc")]
@@ -838,6 +884,14 @@ macro_rules! delegate_to_inner {
                 ObAny::ApsvB64(ob) => ob.$method($($arg),*),
                 #[cfg(feature = "apsv")]
                 ObAny::ApsvHex(ob) => ob.$method($($arg),*),
+                #[cfg(feature = "apae")]
+                ObAny::ApaeC32(ob) => ob.$method($($arg),*),
+                #[cfg(feature = "apae")]
+                ObAny::ApaeB32(ob) => ob.$method($($arg),*),
+                #[cfg(feature = "apae")]
+                ObAny::ApaeB64(ob) => ob.$method($($arg),*),
+                #[cfg(feature = "apae")]
+                ObAny::ApaeHex(ob) => ob.$method($($arg),*),
                 #[cfg(feature = "upbc")]
                 ObAny::UpbcC32(ob) => ob.$method($($arg),*),
                 #[cfg(feature = "upbc")]
@@ -1138,6 +1192,14 @@ pub fn new_with_format(format: Format, key: &str) -> Result<ObAny, Error> {
         (Scheme::Apsv, Encoding::B64) => Ok(ObAny::ApsvB64(ApsvB64::new(key)?)),
         #[cfg(feature = "apsv")]
         (Scheme::Apsv, Encoding::Hex) => Ok(ObAny::ApsvHex(ApsvHex::new(key)?)),
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::C32) => Ok(ObAny::ApaeC32(ApaeC32::new(key)?)),
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::B32) => Ok(ObAny::ApaeB32(ApaeB32::new(key)?)),
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::B64) => Ok(ObAny::ApaeB64(ApaeB64::new(key)?)),
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::Hex) => Ok(ObAny::ApaeHex(ApaeHex::new(key)?)),
         // Testing
         #[cfg(feature = "mock")]
         (Scheme::Mock1, Encoding::C32) => Ok(ObAny::Mock1C32(Mock1C32::new(key)?)),
@@ -1243,6 +1305,22 @@ fn from_bytes_with_format_internal(format: Format, key_bytes: &[u8; 64]) -> Resu
         (Scheme::Apsv, Encoding::Hex) => {
             Ok(ObAny::ApsvHex(ApsvHex::from_bytes_internal(key_bytes)?))
         }
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::C32) => {
+            Ok(ObAny::ApaeC32(ApaeC32::from_bytes_internal(key_bytes)?))
+        }
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::B32) => {
+            Ok(ObAny::ApaeB32(ApaeB32::from_bytes_internal(key_bytes)?))
+        }
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::B64) => {
+            Ok(ObAny::ApaeB64(ApaeB64::from_bytes_internal(key_bytes)?))
+        }
+        #[cfg(feature = "apae")]
+        (Scheme::Apae, Encoding::Hex) => {
+            Ok(ObAny::ApaeHex(ApaeHex::from_bytes_internal(key_bytes)?))
+        }
         // Testing
         #[cfg(feature = "mock")]
         (Scheme::Mock1, Encoding::C32) => {
@@ -45,6 +45,7 @@ pub const SCHEME_MARKER_SIZE: usize = 2;
 //   - 0001 (1): CBC
 //   - 0010 (2): GCM-SIV
 //   - 0011 (3): SIV
+//   - 0100 (4): AEGIS-128L
 
 // Helper function to construct scheme marker
 const fn make_marker(tier: u8, properties: u8, algorithm: u8) -> [u8; 2] {
@@ -71,6 +72,10 @@ pub const AASV_MARKER: [u8; 2] = make_marker(1, 1, 3);
 #[cfg(feature = "apsv")]
 pub const APSV_MARKER: [u8; 2] = make_marker(1, 0, 3);
 
+// apae: tier=001, properties=0000 (probabilistic), algorithm=0100 (AEGIS-128L)
+#[cfg(feature = "apae")]
+pub const APAE_MARKER: [u8; 2] = make_marker(1, 0, 4);
+
 // `u`-tier - Secure, unauthenticated
 // ----------------------------------
 // upbc: tier=010, properties=0000 (probabilistic), algorithm=0001 (CBC)
@@ -134,6 +139,14 @@ pub(crate) mod apsv_constants {
     pub const APSV_HEX_STR: &str = "apsv.hex";
 }
 
+#[cfg(feature = "apae")]
+pub(crate) mod apae_constants {
+    pub const APAE_C32_STR: &str = "apae.c32";
+    pub const APAE_B32_STR: &str = "apae.b32";
+    pub const APAE_B64_STR: &str = "apae.b64";
+    pub const APAE_HEX_STR: &str = "apae.hex";
+}
+
 #[cfg(feature = "upbc")]
 pub(crate) mod upbc_constants {
     pub const UPBC_C32_STR: &str = "upbc.c32";
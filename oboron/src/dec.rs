@@ -4,13 +4,14 @@ use crate::{
     error::Error,
     Encoding, Format, Scheme,
 };
-use data_encoding::{BASE64URL_NOPAD, HEXLOWER};
 
 // Conditionally import decrypt functions
 #[cfg(feature = "aags")]
 use crate::decrypt_aags;
 #[cfg(feature = "aasv")]
 use crate::decrypt_aasv;
+#[cfg(feature = "apae")]
+use crate::decrypt_apae;
 #[cfg(feature = "apgs")]
 use crate::decrypt_apgs;
 #[cfg(feature = "apsv")]
@@ -66,6 +67,8 @@ pub(crate) fn dec_from_format(
         Scheme::Aasv => decrypt_aasv(master_key, &buffer)?,
         #[cfg(feature = "apsv")]
         Scheme::Apsv => decrypt_apsv(master_key, &buffer)?,
+        #[cfg(feature = "apae")]
+        Scheme::Apae => decrypt_apae(master_key, &buffer)?,
         #[cfg(feature = "upbc")]
         Scheme::Upbc => decrypt_upbc(master_key, &mut buffer)?,
         #[cfg(feature = "mock")]
@@ -104,11 +107,7 @@ pub(crate) fn decode_obtext_to_payload(obtext: &str, encoding: Encoding) -> Resu
         Encoding::C32 => BASE32_CROCKFORD
             .decode(obtext.as_bytes())
             .map_err(|_| Error::InvalidC32),
-        Encoding::B64 => BASE64URL_NOPAD
-            .decode(obtext.as_bytes())
-            .map_err(|_| Error::InvalidB64),
-        Encoding::Hex => HEXLOWER
-            .decode(obtext.as_bytes())
-            .map_err(|_| Error::InvalidHex),
+        Encoding::B64 => crate::base64::decode(obtext),
+        Encoding::Hex => crate::base16::decode(obtext),
     }
 }
@@ -4,6 +4,8 @@ use crate::{constants::SCHEME_MARKER_SIZE, error::Error, Encoding, MasterKey};
 use crate::{constants::AAGS_MARKER, decrypt_aags};
 #[cfg(feature = "aasv")]
 use crate::{constants::AASV_MARKER, decrypt_aasv};
+#[cfg(feature = "apae")]
+use crate::{constants::APAE_MARKER, decrypt_apae};
 #[cfg(feature = "apgs")]
 use crate::{constants::APGS_MARKER, decrypt_apgs};
 #[cfg(feature = "apsv")]
@@ -16,6 +18,41 @@ use crate::{constants::MOCK1_MARKER, decrypt_mock1};
 #[cfg(feature = "mock")]
 use crate::{constants::MOCK2_MARKER, decrypt_mock2};
 
+// Character classes used for encoding autodetection, one bit each
+pub(crate) const CLASS_B64: u8 = 1 << 0; // '-' or '_' (base64 only)
+pub(crate) const CLASS_UPPER: u8 = 1 << 1; // 'A'..='Z'
+pub(crate) const CLASS_LOWER: u8 = 1 << 2; // 'a'..='z'
+pub(crate) const CLASS_NON_HEX_LOWER: u8 = 1 << 3; // 'g'..='z'
+
+const fn build_char_classes() -> [u8; 256] {
+    let mut table = [0u8; 256];
+    let mut b = 0;
+    while b < 256 {
+        let c = b as u8;
+        table[b] = match c {
+            b'-' | b'_' => CLASS_B64,
+            b'A'..=b'Z' => CLASS_UPPER,
+            b'a'..=b'f' => CLASS_LOWER,
+            b'g'..=b'z' => CLASS_LOWER | CLASS_NON_HEX_LOWER,
+            _ => 0,
+        };
+        b += 1;
+    }
+    table
+}
+
+static CHAR_CLASSES: [u8; 256] = build_char_classes();
+
+/// OR of the character classes of all bytes in `obtext`.
+///
+/// One branch-free table lookup per byte instead of a chain of range checks.
+#[inline]
+pub(crate) fn char_classes(obtext: &str) -> u8 {
+    obtext
+        .bytes()
+        .fold(0, |classes, b| classes | CHAR_CLASSES[b as usize])
+}
+
 /// Decode the given encoding, then decrypt autodetecting the scheme (SECURE SCHEMES ONLY)
 pub fn dec_any_scheme(
     masterkey: &MasterKey,
@@ -50,6 +87,8 @@ pub fn dec_any_scheme(
         AASV_MARKER => decrypt_aasv(masterkey.key(), &buffer)?,
         #[cfg(feature = "apsv")]
         APSV_MARKER => decrypt_apsv(masterkey.key(), &buffer)?,
+        #[cfg(feature = "apae")]
+        APAE_MARKER => decrypt_apae(masterkey.key(), &buffer)?,
         // Testing
         #[cfg(feature = "mock")]
         MOCK1_MARKER => decrypt_mock1(masterkey.key(), &buffer)?,
@@ -106,29 +145,14 @@ pub(crate) fn dec_any_scheme_hex(masterkey: &MasterKey, obtext: &str) -> Result<
 /// 2. Else if text contains non-hex lowercase letters (g-z) -> Try Base32, fallback to B64
 /// 3. Else -> Try Hex, fallback to Base32, then B64
 pub fn dec_any_format(masterkey: &MasterKey, obtext: &str) -> Result<String, Error> {
-    // Single-pass classification
-    let mut has_dash = false;
-    let mut has_underscore = false;
-    let mut has_upper = false;
-    let mut has_lower = false;
-    let mut has_non_hex_lower = false;
-
-    for b in obtext.bytes() {
-        match b {
-            b'-' => has_dash = true,
-            b'_' => has_underscore = true,
-            b'A'..=b'Z' => has_upper = true,
-            b'a'..=b'f' => has_lower = true,
-            b'g'..=b'z' => {
-                has_lower = true;
-                has_non_hex_lower = true;
-            }
-            _ => {}
-        }
-    }
+    // Single-pass, table-driven classification
+    let classes = char_classes(obtext);
+    let has_upper = classes & CLASS_UPPER != 0;
+    let has_lower = classes & CLASS_LOWER != 0;
+    let has_non_hex_lower = classes & CLASS_NON_HEX_LOWER != 0;
 
     // Check for B64 indicators: '-', '_', or mixed case letters (definitive)
-    if has_dash || has_underscore || (has_lower && has_upper) {
+    if classes & CLASS_B64 != 0 || (has_lower && has_upper) {
         if let Ok(result) = dec_any_scheme_b64(masterkey, obtext) {
             return Ok(result);
         }
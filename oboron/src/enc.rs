@@ -3,13 +3,14 @@ use crate::{
     error::Error,
     Encoding, Format, Scheme,
 };
-use data_encoding::{BASE64URL_NOPAD, HEXLOWER};
 
 // Conditionally import encrypt functions
 #[cfg(feature = "aags")]
 use crate::encrypt_aags;
 #[cfg(feature = "aasv")]
 use crate::encrypt_aasv;
+#[cfg(feature = "apae")]
+use crate::encrypt_apae;
 #[cfg(feature = "apgs")]
 use crate::encrypt_apgs;
 #[cfg(feature = "apsv")]
@@ -48,6 +49,8 @@ pub(crate) fn enc_to_format(
         Scheme::Aasv => encrypt_aasv(master_key, plaintext.as_bytes())?,
         #[cfg(feature = "apsv")]
         Scheme::Apsv => encrypt_apsv(master_key, plaintext.as_bytes())?,
+        #[cfg(feature = "apae")]
+        Scheme::Apae => encrypt_apae(master_key, plaintext.as_bytes())?,
         #[cfg(feature = "upbc")]
         Scheme::Upbc => encrypt_upbc(master_key, plaintext.as_bytes())?,
         #[cfg(feature = "mock")]
@@ -73,7 +76,7 @@ pub(crate) fn enc_to_format(
     Ok(match format.encoding() {
         Encoding::C32 => BASE32_CROCKFORD.encode(&ciphertext),
         Encoding::B32 => BASE32_RFC.encode(&ciphertext),
-        Encoding::B64 => BASE64URL_NOPAD.encode(&ciphertext),
-        Encoding::Hex => HEXLOWER.encode(&ciphertext),
+        Encoding::B64 => crate::base64::encode(&ciphertext),
+        Encoding::Hex => crate::base16::encode(&ciphertext),
     })
 }
@@ -36,6 +36,15 @@ impl Encoding {
     pub fn from_str(s: &str) -> Result<Self, Error> {
         s.parse()
     }
+
+    /// Length of the (unpadded) text encoding of `len` bytes.
+    pub fn encoded_len(&self, len: usize) -> usize {
+        match self {
+            Encoding::C32 | Encoding::B32 => (len * 8).div_ceil(5),
+            Encoding::B64 => (len * 4).div_ceil(3),
+            Encoding::Hex => len * 2,
+        }
+    }
 }
 
 impl std::str::FromStr for Encoding {
@@ -24,6 +24,14 @@ impl Format {
     pub fn encoding(&self) -> Encoding {
         self.encoding
     }
+
+    /// Upper bound on the obtext length for a plaintext of `plaintext_len` bytes.
+    ///
+    /// Useful for sizing a reusable output buffer before encrypting.
+    pub fn max_obtext_len(&self, plaintext_len: usize) -> usize {
+        self.encoding
+            .encoded_len(self.scheme.max_payload_len(plaintext_len))
+    }
 }
 
 #[cfg(feature = "zrbcx")]
@@ -80,6 +88,15 @@ pub(crate) mod apsv_formats {
     pub const APSV_HEX: Format = Format::new(Scheme::Apsv, Encoding::Hex);
 }
 
+#[cfg(feature = "apae")]
+pub(crate) mod apae_formats {
+    use super::{Encoding, Format, Scheme};
+    pub const APAE_C32: Format = Format::new(Scheme::Apae, Encoding::C32);
+    pub const APAE_B32: Format = Format::new(Scheme::Apae, Encoding::B32);
+    pub const APAE_B64: Format = Format::new(Scheme::Apae, Encoding::B64);
+    pub const APAE_HEX: Format = Format::new(Scheme::Apae, Encoding::Hex);
+}
+
 #[cfg(feature = "legacy")]
 pub(crate) mod legacy_formats {
     use super::{Encoding, Format, Scheme};
@@ -167,6 +184,15 @@ impl Format {
             #[cfg(feature = "apsv")]
             crate::APSV_HEX_STR => apsv_formats::APSV_HEX,
 
+            #[cfg(feature = "apae")]
+            crate::APAE_C32_STR => apae_formats::APAE_C32,
+            #[cfg(feature = "apae")]
+            crate::APAE_B32_STR => apae_formats::APAE_B32,
+            #[cfg(feature = "apae")]
+            crate::APAE_B64_STR => apae_formats::APAE_B64,
+            #[cfg(feature = "apae")]
+            crate::APAE_HEX_STR => apae_formats::APAE_HEX,
+
             // Testing
 
             // mock1 variants
@@ -295,6 +321,8 @@ mod tests {
             Scheme::Aasv,
             #[cfg(feature = "apsv")]
             Scheme::Apsv,
+            #[cfg(feature = "apae")]
+            Scheme::Apae,
             // Testing
             #[cfg(feature = "mock")]
             Scheme::Mock1,
@@ -414,6 +442,14 @@ mod tests {
             (Scheme::Apsv, Encoding::Hex, "apsv.hex"),
         ]);
 
+        #[cfg(feature = "apae")]
+        test_cases.extend(vec![
+            (Scheme::Apae, Encoding::C32, "apae.c32"),
+            (Scheme::Apae, Encoding::B32, "apae.b32"),
+            (Scheme::Apae, Encoding::B64, "apae.b64"),
+            (Scheme::Apae, Encoding::Hex, "apae.hex"),
+        ]);
+
         for (scheme, encoding, expected_str) in test_cases {
             // Test Format::to_string()
             let format = Format::new(scheme, encoding);
@@ -50,6 +50,43 @@ pub fn generate_key_bytes() -> [u8; 64] {
     decoded.try_into().expect("Decoded key is not 64 bytes")
 }
 
+/// Generate `n` cryptographically secure random 64-byte keys in one batch.
+///
+/// The keys are written into a single allocation from one RNG handle, so
+/// generating many keys (key rotation, test fixtures) costs one call instead
+/// of one per key.  Unlike [`generate_key_bytes`], the keys are not filtered
+/// for a dash-free base64 form; any 512-bit key is accepted by
+/// `MasterKey::from_bytes()`.
+///
+/// Returns `None` if `n` keys (`n * 64` bytes) cannot be allocated.
+///
+/// # Examples
+///
+/// ```
+/// use oboron::generate_keys_bytes;
+///
+/// let keys = generate_keys_bytes(3).unwrap();
+/// assert_eq!(keys.len(), 3);
+/// assert_ne!(keys[0], keys[1]);
+///
+/// assert!(generate_keys_bytes(usize::MAX).is_none());
+/// ```
+#[must_use]
+#[cfg(feature = "bytes-keys")]
+pub fn generate_keys_bytes(n: usize) -> Option<Vec<[u8; 64]>> {
+    // Reject `n * 64` overflow up front and allocation failure below, instead
+    // of panicking or aborting.
+    n.checked_mul(64)?;
+    let mut keys = Vec::new();
+    keys.try_reserve_exact(n).ok()?;
+    keys.resize(n, [0u8; 64]);
+    let mut rng = rand::thread_rng();
+    for key in &mut keys {
+        rng.fill_bytes(key);
+    }
+    Some(keys)
+}
+
 /// Generate a cryptographically secure random 64-byte key and return it as a hex string.
 ///
 /// This is a convenience function that generates a key and encodes it as a hexadecimal string,
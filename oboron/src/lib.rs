@@ -177,6 +177,7 @@
 //!   - `Aasv`: deterministic AES-SIV (nonce-misuse resistant)
 //!   - `Apgs`: probabilistic AES-GCM-SIV
 //!   - `Apsv`: probabilistic AES-SIV
+//!   - `Apae`: probabilistic AEGIS-128L (`apae` feature, experimental)
 //! - Un-authenticated:
 //!   - `Upbc`: probabilistic AES-CBC
 //! - Insecure (obfuscation only):
@@ -218,7 +219,9 @@
 //!
 //! The `ObtextCodec` trait is automatically imported via the prelude.
 
+mod base16;
 mod base32;
+mod base64;
 mod codec;
 mod constants;
 mod dec;
@@ -248,6 +251,8 @@ pub(crate) use masterkey::MasterKey;
 pub(crate) use obcrypt::{decrypt_aags, encrypt_aags};
 #[cfg(feature = "aasv")]
 pub(crate) use obcrypt::{decrypt_aasv, encrypt_aasv};
+#[cfg(feature = "apae")]
+pub(crate) use obcrypt::{decrypt_apae, encrypt_apae};
 #[cfg(feature = "apgs")]
 pub(crate) use obcrypt::{decrypt_apgs, encrypt_apgs};
 #[cfg(feature = "apsv")]
@@ -268,6 +273,8 @@ pub(crate) use ztier::{decrypt_zmock1, encrypt_zmock1};
 pub use keygen::generate_key;
 #[cfg(feature = "bytes-keys")]
 pub use keygen::generate_key_bytes;
+#[cfg(feature = "bytes-keys")]
+pub use keygen::generate_keys_bytes;
 #[cfg(feature = "hex-keys")]
 pub use keygen::generate_key_hex;
 pub use keygen::generate_secret;
@@ -298,6 +305,8 @@ pub use codec::{new_keyless, new_keyless_with_format};
 pub use constants::aags_constants::*;
 #[cfg(feature = "aasv")]
 pub use constants::aasv_constants::*;
+#[cfg(feature = "apae")]
+pub use constants::apae_constants::*;
 #[cfg(feature = "apgs")]
 pub use constants::apgs_constants::*;
 #[cfg(feature = "apsv")]
@@ -319,6 +328,8 @@ pub use constants::zmock_constants::*;
 pub use format::aags_formats::*;
 #[cfg(feature = "aasv")]
 pub use format::aasv_formats::*;
+#[cfg(feature = "apae")]
+pub use format::apae_formats::*;
 #[cfg(feature = "apgs")]
 pub use format::apgs_formats::*;
 #[cfg(feature = "apsv")]
@@ -341,6 +352,8 @@ pub use format::zmock_formats::*;
 pub use codec::{AagsB32, AagsB64, AagsC32, AagsHex};
 #[cfg(feature = "aasv")]
 pub use codec::{AasvB32, AasvB64, AasvC32, AasvHex};
+#[cfg(feature = "apae")]
+pub use codec::{ApaeB32, ApaeB64, ApaeC32, ApaeHex};
 #[cfg(feature = "apgs")]
 pub use codec::{ApgsB32, ApgsB64, ApgsC32, ApgsHex};
 #[cfg(feature = "apsv")]
@@ -367,6 +380,8 @@ pub mod prelude {
     pub use crate::{AagsB32, AagsB64, AagsC32, AagsHex};
     #[cfg(feature = "aasv")]
     pub use crate::{AasvB32, AasvB64, AasvC32, AasvHex};
+    #[cfg(feature = "apae")]
+    pub use crate::{ApaeB32, ApaeB64, ApaeC32, ApaeHex};
     #[cfg(feature = "apgs")]
     pub use crate::{ApgsB32, ApgsB64, ApgsC32, ApgsHex};
     #[cfg(feature = "apsv")]
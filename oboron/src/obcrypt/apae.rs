@@ -0,0 +1,60 @@
+#![cfg(feature = "apae")]
+use crate::Error;
+use aegis::aegis128l::Aegis128L;
+use rand::RngCore;
+
+const KEY_OFFSET: usize = 0;
+const KEY_LEN: usize = 16;
+const NONCE_SIZE: usize = 16;
+const TAG_SIZE: usize = 16;
+const MIN_PAYLOAD_LEN: usize = NONCE_SIZE + 1 + TAG_SIZE;
+
+/// Encrypt plaintext bytes using probabilistic AEGIS-128L (apae scheme).
+/// Takes the full 64-byte key and extracts the first 16 bytes internally.
+///
+/// Payload layout: `nonce (16) || ciphertext || tag (16)`.
+#[inline]
+pub fn encrypt(master_key: &[u8; 64], plaintext_bytes: &[u8]) -> Result<Vec<u8>, Error> {
+    if plaintext_bytes.is_empty() {
+        return Err(Error::EmptyPlaintext);
+    }
+
+    let key_slice = &master_key[KEY_OFFSET..KEY_OFFSET + KEY_LEN];
+    let key: &[u8; KEY_LEN] = key_slice.try_into().unwrap();
+
+    let mut buffer = Vec::with_capacity(NONCE_SIZE + plaintext_bytes.len() + TAG_SIZE);
+    buffer.resize(NONCE_SIZE, 0);
+    rand::thread_rng().fill_bytes(&mut buffer[..NONCE_SIZE]);
+    buffer.extend_from_slice(plaintext_bytes);
+
+    let (nonce, message) = buffer.split_at_mut(NONCE_SIZE);
+    let nonce: &[u8; NONCE_SIZE] = (&*nonce).try_into().unwrap();
+    let tag = Aegis128L::<TAG_SIZE>::new(key, nonce).encrypt_in_place(message, &[]);
+
+    buffer.extend_from_slice(&tag);
+    Ok(buffer)
+}
+
+/// Decrypt ciphertext using probabilistic AEGIS-128L (apae scheme).
+/// Takes the full 64-byte key and extracts the first 16 bytes internally.
+#[inline]
+pub fn decrypt(master_key: &[u8; 64], data: &[u8]) -> Result<Vec<u8>, Error> {
+    if data.len() < MIN_PAYLOAD_LEN {
+        return Err(Error::PayloadTooShort);
+    }
+
+    let key_slice = &master_key[KEY_OFFSET..KEY_OFFSET + KEY_LEN];
+    let key: &[u8; KEY_LEN] = key_slice.try_into().unwrap();
+
+    let (nonce, rest) = data.split_at(NONCE_SIZE);
+    let (ciphertext, tag) = rest.split_at(rest.len() - TAG_SIZE);
+    let nonce: &[u8; NONCE_SIZE] = nonce.try_into().unwrap();
+    let tag: &[u8; TAG_SIZE] = tag.try_into().unwrap();
+
+    let mut plaintext = ciphertext.to_vec();
+    Aegis128L::<TAG_SIZE>::new(key, nonce)
+        .decrypt_in_place(&mut plaintext, tag, &[])
+        .map_err(|_| Error::DecryptionFailed)?;
+
+    Ok(plaintext)
+}
@@ -6,6 +6,8 @@ mod constants;
 mod aags; //  AES-GCM-SIV (deterministic)
 #[cfg(feature = "aasv")]
 mod aasv; //  AES-SIV (deterministic)
+#[cfg(feature = "apae")]
+mod apae; // AEGIS-128L (probabilistic, experimental)
 #[cfg(feature = "apgs")]
 mod apgs; // AES-GCM-SIV (probabilistic)
 #[cfg(feature = "apsv")]
@@ -23,6 +25,8 @@ mod mock2; // Identity // String reversal
 pub use aags::{decrypt as decrypt_aags, encrypt as encrypt_aags};
 #[cfg(feature = "aasv")]
 pub use aasv::{decrypt as decrypt_aasv, encrypt as encrypt_aasv};
+#[cfg(feature = "apae")]
+pub use apae::{decrypt as decrypt_apae, encrypt as encrypt_apae};
 #[cfg(feature = "apgs")]
 pub use apgs::{decrypt as decrypt_apgs, encrypt as encrypt_apgs};
 #[cfg(feature = "apsv")]
@@ -13,6 +13,8 @@ pub enum Scheme {
     Aasv,
     #[cfg(feature = "apsv")]
     Apsv,
+    #[cfg(feature = "apae")]
+    Apae,
     #[cfg(feature = "upbc")]
     Upbc,
     // Z-tier
@@ -42,6 +44,8 @@ impl Scheme {
             Scheme::Aasv => "aasv",
             #[cfg(feature = "apsv")]
             Scheme::Apsv => "apsv",
+            #[cfg(feature = "apae")]
+            Scheme::Apae => "apae",
             #[cfg(feature = "upbc")]
             Scheme::Upbc => "upbc",
             // Z-tier
@@ -76,6 +80,8 @@ impl Scheme {
             Scheme::Aasv => true,
             #[cfg(feature = "apsv")]
             Scheme::Apsv => false,
+            #[cfg(feature = "apae")]
+            Scheme::Apae => false,
             #[cfg(feature = "upbc")]
             Scheme::Upbc => false,
             // Z-tier
@@ -110,6 +116,8 @@ impl Scheme {
             Scheme::Aasv => constants::AASV_MARKER,
             #[cfg(feature = "apsv")]
             Scheme::Apsv => constants::APSV_MARKER,
+            #[cfg(feature = "apae")]
+            Scheme::Apae => constants::APAE_MARKER,
             #[cfg(feature = "upbc")]
             Scheme::Upbc => constants::UPBC_MARKER,
             // Z-tier
@@ -128,6 +136,39 @@ impl Scheme {
         }
     }
 
+    /// Upper bound on the payload length (ciphertext plus any nonce/IV, tag
+    /// and the 2-byte scheme marker) for a plaintext of `plaintext_len` bytes.
+    pub fn max_payload_len(&self, plaintext_len: usize) -> usize {
+        match self {
+            // Tag (GCM-SIV) or synthetic IV (SIV), no nonce
+            #[cfg(feature = "aags")]
+            Scheme::Aags => plaintext_len + 16 + 2,
+            #[cfg(feature = "aasv")]
+            Scheme::Aasv => plaintext_len + 16 + 2,
+            // Nonce + tag
+            #[cfg(feature = "apgs")]
+            Scheme::Apgs => 12 + plaintext_len + 16 + 2,
+            #[cfg(feature = "apsv")]
+            Scheme::Apsv => 16 + plaintext_len + 16 + 2,
+            #[cfg(feature = "apae")]
+            Scheme::Apae => 16 + plaintext_len + 16 + 2,
+            // IV + plaintext padded to the AES block
+            #[cfg(feature = "upbc")]
+            Scheme::Upbc => 16 + plaintext_len.div_ceil(16) * 16 + 2,
+            // Z-tier
+            #[cfg(feature = "zrbcx")]
+            Scheme::Zrbcx => plaintext_len.div_ceil(16) * 16 + 2,
+            // Testing
+            #[cfg(feature = "mock")]
+            Scheme::Mock1 | Scheme::Mock2 => plaintext_len + 2,
+            #[cfg(feature = "zmock")]
+            Scheme::Zmock1 => plaintext_len + 2,
+            // Legacy: padded to the AES block, no marker
+            #[cfg(feature = "legacy")]
+            Scheme::Legacy => plaintext_len.div_ceil(16) * 16,
+        }
+    }
+
     /// Legacy compatibility:  get single byte representation (deprecated)
     #[deprecated(
         since = "1.0.0",
@@ -152,6 +193,8 @@ impl std::str::FromStr for Scheme {
             "aasv" => Ok(Scheme::Aasv),
             #[cfg(feature = "apsv")]
             "apsv" => Ok(Scheme::Apsv),
+            #[cfg(feature = "apae")]
+            "apae" => Ok(Scheme::Apae),
             #[cfg(feature = "upbc")]
             "upbc" => Ok(Scheme::Upbc),
             // Z-tier
@@ -3,7 +3,12 @@
 #![cfg(feature = "ztier")]
 
 use super::zsecret::ZSecret;
-use crate::{constants::SCHEME_MARKER_SIZE, error::Error, Encoding};
+use crate::{
+    constants::SCHEME_MARKER_SIZE,
+    dec_auto::{char_classes, CLASS_B64, CLASS_LOWER, CLASS_NON_HEX_LOWER, CLASS_UPPER},
+    error::Error,
+    Encoding,
+};
 
 #[cfg(feature = "zmock")]
 use super::zmock1::decrypt_zmock1;
@@ -168,19 +173,20 @@ pub(crate) fn dec_any_scheme_hex_ztier(zsecret: &ZSecret, obtext: &str) -> Resul
 /// 2. Else if text contains non-hex lowercase letters (g-z) -> Try Base32, fallback to B64
 /// 3. Else -> Try Hex, fallback to Base32, then B64
 pub(crate) fn dec_any_format_ztier(zsecret: &ZSecret, obtext: &str) -> Result<String, Error> {
+    // Single-pass, table-driven classification
+    let classes = char_classes(obtext);
+    let has_upper = classes & CLASS_UPPER != 0;
+    let has_lower = classes & CLASS_LOWER != 0;
+
     // Check for B64 indicators:  '-', '_', or mixed case letters (definitive)
-    if obtext.contains('-')
-        || obtext.contains('_')
-        || (obtext.chars().any(|c| c.is_ascii_lowercase())
-            && obtext.chars().any(|c| c.is_ascii_uppercase()))
-    {
+    if classes & CLASS_B64 != 0 || (has_lower && has_upper) {
         if let Ok(result) = dec_any_scheme_b64_ztier(zsecret, obtext) {
             return Ok(result);
         }
     }
 
     // Check for uppercase letters, indicating B32
-    if obtext.chars().any(|c| c.is_ascii_uppercase()) {
+    if has_upper {
         // Try B32 first, fallback to B64 (no point trying hex)
         if let Ok(result) = dec_any_scheme_b32_ztier(zsecret, obtext) {
             return Ok(result);
@@ -191,7 +197,7 @@ pub(crate) fn dec_any_format_ztier(zsecret: &ZSecret, obtext: &str) -> Result<St
     }
 
     // Check for non-hex lowercase letters (g-z), indicating C32
-    if obtext.chars().any(|c| c.is_ascii_lowercase() && c > 'f') {
+    if classes & CLASS_NON_HEX_LOWER != 0 {
         // Try C32 first, fallback to B64 (no point trying hex)
         if let Ok(result) = dec_any_scheme_c32_ztier(zsecret, obtext) {
             return Ok(result);
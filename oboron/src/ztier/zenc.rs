@@ -7,7 +7,6 @@ use crate::{
     error::Error,
     Encoding, Format, Scheme,
 };
-use data_encoding::{BASE64URL_NOPAD, HEXLOWER};
 
 #[cfg(feature = "zmock")]
 use crate::encrypt_zmock1;
@@ -46,7 +45,7 @@ pub(crate) fn enc_to_format_ztier(
     Ok(match format.encoding() {
         Encoding::C32 => BASE32_CROCKFORD.encode(&ciphertext),
         Encoding::B32 => BASE32_RFC.encode(&ciphertext),
-        Encoding::B64 => BASE64URL_NOPAD.encode(&ciphertext),
-        Encoding::Hex => HEXLOWER.encode(&ciphertext),
+        Encoding::B64 => crate::base64::encode(&ciphertext),
+        Encoding::Hex => crate::base16::encode(&ciphertext),
     })
 }
@@ -177,3 +177,42 @@ fn test_ob_generic_usage() {
     let ot = enc_with_oboron(&ob, "generic test");
     assert!(ot.len() > 0);
 }
+
+#[test]
+fn test_ob_max_obtext_len() {
+    let key = [0u8; 64];
+    let formats = [
+        "mock1.c32",
+        "mock1.b32",
+        "mock2.b64",
+        "mock2.hex",
+        #[cfg(feature = "aags")]
+        "aags.b64",
+        #[cfg(feature = "aasv")]
+        "aasv.c32",
+        #[cfg(feature = "apgs")]
+        "apgs.b32",
+        #[cfg(feature = "apsv")]
+        "apsv.hex",
+        #[cfg(feature = "upbc")]
+        "upbc.c32",
+        #[cfg(feature = "upbc")]
+        "upbc.b64",
+    ];
+
+    for format in formats {
+        let ob = Ob::from_bytes(format, &key).expect("Failed to create Ob");
+        for len in 1..=40 {
+            let plaintext = "x".repeat(len);
+            let ot = ob.enc(&plaintext).expect("Failed to enc");
+            // The bound is exact for every current scheme
+            assert_eq!(
+                ot.len(),
+                ob.format().max_obtext_len(len),
+                "{} with {} bytes",
+                format,
+                len
+            );
+        }
+    }
+}
@@ -6,6 +6,8 @@ use oboron::AagsB64;
 use oboron::UpbcB64;
 #[cfg(feature = "aasv")]
 use oboron::{AasvB64, AasvC32, AasvHex};
+#[cfg(feature = "apae")]
+use oboron::{ApaeB64, ApaeC32, ApaeHex};
 #[cfg(feature = "apgs")]
 use oboron::{ApgsB64, ApgsC32, ApgsHex};
 #[cfg(feature = "apsv")]
@@ -167,6 +169,72 @@ fn test_apsv_all_encodings() {
     eprintln!("✓ Apsv all encodings test passed");
 }
 
+#[test]
+#[cfg(feature = "apae")]
+fn test_apae_basic() {
+    let key = [0u8; 64];
+    let ob = ApaeC32::from_bytes(&key).expect("Failed to create ApaeC32");
+
+    let plaintext = "Testing ApaeC32 scheme";
+    let ot1 = ob.enc(plaintext).expect("Failed to enc");
+    let ot2 = ob.enc(plaintext).expect("Failed to enc");
+
+    // ApaeC32 is probabilistic, so two encodings should be different
+    assert_ne!(
+        ot1, ot2,
+        "ApaeC32 should produce different ciphertexts for the same plaintext"
+    );
+
+    // But both should dec to the same plaintext
+    assert_eq!(
+        ob.dec(&ot1).expect("Failed to dec first encoding"),
+        plaintext
+    );
+    assert_eq!(
+        ob.dec(&ot2).expect("Failed to dec second encoding"),
+        plaintext
+    );
+
+    // A tampered obtext must fail authentication
+    let mut tampered = ot1.into_bytes();
+    let mid = tampered.len() / 2;
+    tampered[mid] = if tampered[mid] == b'0' { b'1' } else { b'0' };
+    let tampered = String::from_utf8(tampered).unwrap();
+    assert!(
+        ob.dec(&tampered).is_err(),
+        "Tampered obtext should be rejected"
+    );
+
+    eprintln!("✓ ApaeC32 basic test passed");
+}
+
+#[test]
+#[cfg(feature = "apae")]
+fn test_apae_all_encodings() {
+    let key = [0u8; 64];
+    let plaintext = "Test apae with different encodings";
+
+    // C32 (default)
+    let ob_c32 = ApaeC32::from_bytes(&key).expect("Failed to create ApaeC32");
+    let ot = ob_c32.enc(plaintext).expect("Failed to enc with base32");
+    let pt2 = ob_c32.dec(&ot).expect("Failed to dec with base32");
+    assert_eq!(pt2, plaintext, "Decoding mismatch for base32");
+
+    // B64
+    let ob_b64 = ApaeB64::from_bytes(&key).expect("Failed to create ApaeB64");
+    let ot = ob_b64.enc(plaintext).expect("Failed to enc with base64");
+    let pt2 = ob_b64.dec(&ot).expect("Failed to dec with base64");
+    assert_eq!(pt2, plaintext, "Decoding mismatch for base64");
+
+    // Hex
+    let ob_hex = ApaeHex::from_bytes(&key).expect("Failed to create ApaeHex");
+    let ot = ob_hex.enc(plaintext).expect("Failed to enc with hex");
+    let pt2 = ob_hex.dec(&ot).expect("Failed to dec with hex");
+    assert_eq!(pt2, plaintext, "Decoding mismatch for hex");
+
+    eprintln!("✓ Apae all encodings test passed");
+}
+
 #[test]
 #[cfg(feature = "aags")]
 #[cfg(feature = "apgs")]